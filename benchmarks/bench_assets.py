@@ -0,0 +1,84 @@
+'''
+:about: benchmark of the assert loading, compares loading every assert of the game from
+    the loose files against loading them from the memory-mapped bundle.
+
+run from the root of the project:
+    python benchmarks/bench_assets.py [--repeat 20]
+
+Note: SDL dummy video/audio drivers are used, no window is opened. The files are in the
+page cache after the first run, so this measures the per-file open/stat/read overhead and
+not the latency of a cold network filesystem.
+'''
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from component.utils import fetch, load_image, load_sound, read_asset, use_bundle
+from component.bundle import build_bundle
+
+DATA_FILENAME = os.path.join("assert", "data.json")
+
+
+def load_all(data: dict) -> float:
+    ''':function: load every assert of the game once.
+
+        :return float: seconds
+    '''
+    start = time.perf_counter()
+    for filename in data["yellowbird"]:
+        load_image(filename)
+    for filename in data["game_objects"].values():
+        load_image(filename)
+    load_image(data["ui"]["message"])
+    load_image(data["ui"]["gameover"])
+    for filename in data["ui"]["numbers"]:
+        load_image(filename)
+    for filename in data["sfx"].values():
+        load_sound(filename)
+    for filename in data["font"].values():
+        read_asset(filename)
+    read_asset(os.path.join("assert", "about.txt"))
+
+    return time.perf_counter() - start
+
+
+def main():
+    ''':function: entry point of the benchmark.'''
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pygame.init()
+    data = fetch(DATA_FILENAME)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "assert.bundle")
+        start = time.perf_counter()
+        manifest = build_bundle("assert", filename)
+        build_time = time.perf_counter() - start
+
+        loose = min(load_all(data) for _ in range(args.repeat))
+
+        start = time.perf_counter()
+        use_bundle(filename)
+        open_time = time.perf_counter() - start
+        packed = min(load_all(data) for _ in range(args.repeat))
+        use_bundle(None)
+
+    print(f"bundle: {len(manifest['files'])} files, built in {build_time * 1000:.2f} ms, "
+          f"opened in {open_time * 1000:.3f} ms")
+    print(f"{'':<14}{'ms/load':>10}")
+    print(f"{'loose files':<14}{loose * 1000:>10.2f}")
+    print(f"{'bundle':<14}{packed * 1000:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''
+:about: benchmark of the easing, compares the import time of the `arcade` library (the old
+    source of the easing) against the in-project `component.easing` module, and the cost
+    of a flap tween: `ease_value`/`ease_update` against a reused :class Tween:.
+
+run from the root of the project:
+    python benchmarks/bench_easing.py [--repeat 5] [--tweens 100000]
+
+Note: each import is timed in a fresh interpreter, the arcade rows are skipped if arcade
+is not installed.
+'''
+import os
+import sys
+import time
+import argparse
+import subprocess
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from component.easing import Tween, ease_out_sin
+
+IMPORTS = (("arcade", "from arcade import ease_value, ease_update, ease_out_sin"),
+           ("component.easing", "from component.easing import Tween, ease_out_sin"))
+
+
+def import_time(statement: str, repeat: int) -> float:
+    ''':function: best wall time of a fresh interpreter running the import statement.
+
+        :return float: seconds, None if the import failed.
+    '''
+    # time of the interpreter itself is removed.
+    times = []
+    for code in ("pass", statement):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                    capture_output=True,
+                                    env=dict(os.environ, SDL_VIDEODRIVER="dummy",
+                                             SDL_AUDIODRIVER="dummy"))
+            elapsed = time.perf_counter() - start
+            if result.returncode:
+                return None
+            best = elapsed if best is None else min(best, elapsed)
+        times.append(best)
+
+    return times[1] - times[0]
+
+
+def tween_arcade(count: int) -> float:
+    ''':function: old path, a new easing data per flap.'''
+    from arcade import ease_value, ease_update, ease_out_sin as arcade_ease_out_sin
+
+    start = time.perf_counter()
+    for _ in range(count):
+        data = ease_value(200, 120, time=0.3, ease_function=arcade_ease_out_sin)
+        for _ in range(4):
+            ease_update(data, 1 / 120)
+    return time.perf_counter() - start
+
+
+def tween_reused(count: int) -> float:
+    ''':function: new path, the same tween is reset on every flap.'''
+    tween = Tween()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        tween.reset(200, 120, 0.3, ease_out_sin)
+        for _ in range(4):
+            tween.update(1 / 120)
+    return time.perf_counter() - start
+
+
+def python_allocations(function, *args) -> int:
+    ''':function: peak of the python heap while running the function.'''
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+
+def main():
+    ''':function: entry point of the benchmark.'''
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tweens", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'import':<20}{'ms':>10}")
+    for name, statement in IMPORTS:
+        seconds = import_time(statement, args.repeat)
+        print(f"{name:<20}{'not installed' if seconds is None else f'{seconds * 1000:.1f}':>10}")
+
+    rows = [("Tween.reset", tween_reused)]
+    try:
+        import arcade  # noqa: F401
+        rows.insert(0, ("ease_value", tween_arcade))
+    except ImportError:
+        pass
+
+    print(f"\n{'flap tween':<20}{'us/flap':>10}{'py peak B':>12}")
+    for name, function in rows:
+        seconds = function(args.tweens)
+        peak = python_allocations(function, args.tweens // 10)
+        print(f"{name:<20}{seconds / args.tweens * 1e6:>10.2f}{peak:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''
+:about: benchmark of the frame pacing, runs the :class FramePacer: of the game loop at each
+    fps of the settings with the sleep and the precise pacing, and reports the frame time,
+    its jitter and the cpu used.
+
+run from the root of the project:
+    python benchmarks/bench_pacing.py                  # empty frames
+    python benchmarks/bench_pacing.py --game           # frames of the running game
+    python benchmarks/bench_pacing.py --fps 0 --game   # uncapped, throughput of the game
+
+report of each mode:
+    fps: frames per second reached.
+    mean ms: mean frame time.
+    jitter ms: standard deviation of the frame time.
+    p99 off ms: 99th percentile of the distance to the frame time of the fps.
+    cpu %: process time over the wall time, the sleep pacing should stay low.
+
+Note: SDL dummy video/audio drivers are used, no window is opened.
+'''
+import os
+import sys
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from flappy import Game, SCREEN_SIZE, TITLE
+from component.ui import FPS_OPTIONS
+from component.pacing import FramePacer
+from bench_suite import keep_flying, percentile, NO_INPUT
+
+
+def game_frame(game: Game) -> object:
+    ''':function: one frame of the running game, drawn and pushed to the display.'''
+    game.new_game()
+    game.change_scene("Start New Game")
+    frame = [0]
+    inputs = dict(NO_INPUT)
+
+    def op(delta_time: float):
+        frame[0] += 1
+        if game._gameover:  # keep playing.
+            game.new_game()
+        inputs["K_SPACE"] = keep_flying(game.flappy, frame[0])
+        game.update(delta_time, **inputs)
+        game.display.update()
+    return op
+
+
+def run_mode(fps: int, precise: bool, seconds: float, frame: object) -> dict:
+    ''':function: run the clock for the seconds.
+
+        :return dict: fps, mean, jitter and p99 distance to the target in milli-seconds, cpu %.
+    '''
+    pacer = FramePacer()
+    pacer.tick(fps, precise)
+
+    times = []
+    delta_time = 0.0
+    cpu_start, start = time.process_time(), time.perf_counter()
+    last = start
+    while last - start < seconds:
+        if frame is not None:
+            frame(delta_time)
+        delta_time = pacer.tick(fps, precise)
+        now = time.perf_counter()
+        times.append((now - last) * 1000)
+        last = now
+    wall, cpu = last - start, time.process_time() - cpu_start
+
+    target = 1000 / fps if fps else statistics.fmean(times)
+    return {"fps": len(times) / wall, "mean": statistics.fmean(times),
+            "jitter": statistics.pstdev(times),
+            "p99": percentile(sorted(abs(value - target) for value in times), 99),
+            "cpu": cpu / wall * 100}
+
+
+def main():
+    ''':function: entry point of the benchmark.'''
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--fps", type=int, nargs="*", default=FPS_OPTIONS,
+                        help="fps to run, 0 is uncapped")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time of each mode")
+    parser.add_argument("--game", action="store_true", help="run the game in each frame")
+    args = parser.parse_args()
+
+    pygame.init()
+    frame = None
+    if args.game:
+        pygame.mixer.set_num_channels(0)  # see bench_suite.
+        game = Game(SCREEN_SIZE, TITLE, seed=0)
+        game.setup()
+        frame = game_frame(game)
+
+    print(f"{'fps':<6}{'pacing':<10}{'fps':>10}{'mean ms':>10}{'jitter ms':>11}"
+          f"{'p99 off ms':>12}{'cpu %':>8}")
+    for fps in args.fps:
+        for precise in (False, True):
+            result = run_mode(fps, precise, args.seconds, frame)
+            print(f"{fps or 'max':<6}{'precise' if precise else 'sleep':<10}"
+                  f"{result['fps']:>10.1f}{result['mean']:>10.3f}{result['jitter']:>11.3f}"
+                  f"{result['p99']:>12.3f}{result['cpu']:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
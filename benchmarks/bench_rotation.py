@@ -0,0 +1,108 @@
+'''
+:about: benchmark of the flappy rotation, compares rotating the image on every frame
+    (the old `pygame.transform.rotate` path) against the pre-rotated atlas lookup of
+    :method Flappy.rotated_image:.
+
+run from the root of the project:
+    python benchmarks/bench_rotation.py [--frames 20000] [--step 1]
+
+Note: SDL dummy video/audio drivers are used, no window is opened.
+'''
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from component.utils import fetch, load_image
+from component.flappy import Flappy
+
+DATA_FILENAME = os.path.join("assert", "data.json")
+
+
+def angles(frames: int) -> list:
+    ''':function: rotation of the flappy over a flight, 30 -> -30 degree repeatedly.'''
+    return [30 - 60 * ((frame % 12) / 11) for frame in range(frames)]
+
+
+def rotate_per_frame(images: list, sequence: list) -> tuple[float, int]:
+    ''':function: old path, a new surface and rect for every frame.
+
+        :return tuple: (seconds, bytes of pixels allocated)
+    '''
+    allocated = 0
+    rect = images[0].get_rect()
+    start = time.perf_counter()
+    for frame, angle in enumerate(sequence):
+        image = pygame.transform.rotate(images[frame % 2], angle)
+        rect = image.get_rect(center=rect.center)
+        allocated += image.get_width() * image.get_height() * image.get_bytesize()
+
+    return time.perf_counter() - start, allocated
+
+
+def atlas_lookup(flappy: Flappy, sequence: list) -> tuple[float, int]:
+    ''':function: new path, lookup of the pre-rotated image and in-place rect update.
+
+        :return tuple: (seconds, bytes of pixels allocated)
+    '''
+    rect = flappy.rect
+    start = time.perf_counter()
+    for frame, angle in enumerate(sequence):
+        image = flappy.rotated_image(frame % 2, angle)
+        center = rect.center
+        rect.size = image.get_size()
+        rect.center = center
+
+    return time.perf_counter() - start, 0
+
+
+def python_allocations(function, *args) -> int:
+    ''':function: peak of the python heap while running the function.'''
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+
+def main():
+    ''':function: entry point of the benchmark.'''
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--step", type=float, default=1)
+    args = parser.parse_args()
+
+    data = fetch(DATA_FILENAME)
+    images = [load_image(filename) for filename in data["yellowbird"]]
+
+    start = time.perf_counter()
+    flappy = Flappy(images, 1, 400, (320, 184), rotation_step=args.step)
+    build_time = time.perf_counter() - start
+    atlas_bytes = sum(image.get_width() * image.get_height() * image.get_bytesize()
+                      for frame in flappy.rotation_atlas for image in frame)
+
+    sequence = angles(args.frames)
+    rows = (("rotate per frame", rotate_per_frame(images, sequence),
+             python_allocations(rotate_per_frame, images, sequence)),
+            ("atlas lookup", atlas_lookup(flappy, sequence),
+             python_allocations(atlas_lookup, flappy, sequence)))
+
+    print(f"frames: {args.frames}, angle step: {args.step}")
+    print(f"atlas: {sum(map(len, flappy.rotation_atlas))} surfaces, "
+          f"{atlas_bytes / 1024:.1f} KiB, built in {build_time * 1000:.2f} ms")
+    print(f"{'':<18}{'us/frame':>10}{'pixel B/frame':>15}{'py peak B':>12}")
+    for name, (seconds, allocated), peak in rows:
+        print(f"{name:<18}{seconds / args.frames * 1e6:>10.2f}"
+              f"{allocated / args.frames:>15.0f}{peak:>12}")
+
+
+if __name__ == '__main__':
+    main()
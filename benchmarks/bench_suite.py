@@ -0,0 +1,294 @@
+'''
+:about: benchmark suite of the hot paths of the game, each case is timed op by op and
+    compared against the stored baseline.
+
+cases:
+    flappy.update, obstical.update, obstical.collision, obstical.collision_mask,
+    moving_image.move, moving_image.blit, parallax.update, parallax.blit,
+    gameui.show_number, boxlayout.blit,
+    game.update[Menu|Settings|About|play|gameover], game.setup
+
+run from the root of the project:
+    python benchmarks/bench_suite.py                   # run and compare to the baseline
+    python benchmarks/bench_suite.py --save-baseline   # run and store the baseline
+    python benchmarks/bench_suite.py --filter game --fail-on-regression
+
+report of each case:
+    ops/s: operations per second over the timed run.
+    p50/p99: per operation time in micro-seconds.
+    peak B: peak of the python heap (tracemalloc) over a run of the case.
+    vs base: speed-up of the p50 against the baseline, regressions are marked with "!".
+
+Note: SDL dummy video/audio drivers are used, no window is opened. The baseline is only
+meaningful on the machine it was saved on.
+'''
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+
+from flappy import Game, SCREEN_SIZE, TITLE
+from component.simulation import FLAPPY_POS
+from component.pipes import ParallaxScroller
+
+BASELINE_FILENAME = os.path.join("benchmarks", "baseline.json")
+NO_INPUT = {"K_SPACE": False, "K_r": False, "K_x": False, "K_p": False}
+DELTA_TIME = 1 / 120
+
+
+def percentile(values: list, percent: float) -> float:
+    ''':function: nearest-rank percentile of the sorted values.'''
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def keep_flying(flappy: object, frame: int) -> bool:
+    ''':function: flap input which keeps the flappy in the middle of the screen.'''
+    if flappy.rect.top > 400 or flappy.rect.bottom < 0:
+        flappy.reset()
+        flappy.move_to(center=FLAPPY_POS)
+    return frame % 40 == 0 and flappy.rect.centery > 200
+
+
+# cases, each one gets the game already set-up and returns the operation to time.
+def case_flappy_update(game: Game) -> object:
+    ''':function: flappy flying and falling.'''
+    flappy = game.flappy
+    frame = [0]
+
+    def op():
+        frame[0] += 1
+        flappy.update(DELTA_TIME, K_SPACE=keep_flying(flappy, frame[0]))
+    return op
+
+
+def case_obstical_update(game: Game) -> object:
+    ''':function: pipes moving, respawning and scoring.'''
+    game.obstical.generate_pipe()
+    return lambda: game.obstical.update(DELTA_TIME)
+
+
+def case_obstical_collision(game: Game) -> object:
+    ''':function: collision of the flappy rect with the pipes.'''
+    game.obstical.generate_pipe()
+    flappy = game.flappy
+    return lambda: game.obstical.collision(flappy.collision_rect)
+
+
+def case_obstical_collision_mask(game: Game) -> object:
+    ''':function: pixel perfect collision of the flappy with the pipes.'''
+    game.obstical.generate_pipe()
+    flappy = game.flappy
+    return lambda: game.obstical.collision(flappy.rect, flappy.mask)
+
+
+def case_moving_image_move(game: Game) -> object:
+    ''':function: scroll of the base.'''
+    base = game.base_image
+    return lambda: base.move_image(None, 100, DELTA_TIME, (-1, 0))
+
+
+def case_moving_image_blit(game: Game) -> object:
+    ''':function: drawing of the base.'''
+    base = game.base_image
+    # SDL copies the tiles faster at some x than at others, they are drawn from the same
+    # place after a second of scrolling, whatever the cases run before.
+    base.reset()
+    for _ in range(120):
+        base.move_image(None, 100, DELTA_TIME, (-1, 0))
+    return lambda: base.blit(game.screen)
+
+
+def parallax(game: Game) -> ParallaxScroller:
+    ''':function: scroller of 4 layers, the 2 middle ones share their speed.'''
+    image = game.background_day_image.image
+    return ParallaxScroller([(image, (0, 0), speed) for speed in (10, 25, 25, 50)])
+
+
+def case_parallax_update(game: Game) -> object:
+    ''':function: scroll of the parallax layers.'''
+    scroller = parallax(game)
+    return lambda: scroller.update(DELTA_TIME)
+
+
+def case_parallax_blit(game: Game) -> object:
+    ''':function: drawing of the parallax layers.'''
+    scroller = parallax(game)
+    scroller.update(DELTA_TIME)
+    return lambda: scroller.blit(game.screen)
+
+
+def case_show_number(game: Game) -> object:
+    ''':function: drawing of the score.'''
+    # the number changes every 100 operations.
+    frame = [0]
+
+    def op():
+        frame[0] += 1
+        game.gameui.show_number(game.screen, frame[0] // 100)
+    return op
+
+
+def case_boxlayout_blit(game: Game) -> object:
+    ''':function: drawing of the game menu.'''
+    return lambda: game.gameui.gamemenu_boxlayout.blit(game.screen)
+
+
+def game_update(state: str, gameover: bool = False) -> object:
+    ''':function: case of a full `Game.update` frame in the state.'''
+    def case(game: Game) -> object:
+        game.new_game()
+        game.change_scene(state)
+        game._allow_update = True
+        game._gameover = gameover
+        frame = [0]
+        inputs = dict(NO_INPUT)
+
+        def op():
+            frame[0] += 1
+            if state == "Start New Game" and not gameover:
+                if game._gameover:  # keep playing.
+                    game.new_game()
+                    game._allow_update = True
+                inputs["K_SPACE"] = keep_flying(game.flappy, frame[0])
+            game.update(DELTA_TIME, **inputs)
+        return op
+    return case
+
+
+def case_game_setup(game: Game) -> object:
+    ''':function: loading of all the assert of the game.'''
+    return game.setup
+
+
+# name -> (case, operations timed)
+CASES = {
+    "flappy.update": (case_flappy_update, 20000),
+    "obstical.update": (case_obstical_update, 20000),
+    "obstical.collision": (case_obstical_collision, 20000),
+    "obstical.collision_mask": (case_obstical_collision_mask, 20000),
+    "moving_image.move": (case_moving_image_move, 20000),
+    "moving_image.blit": (case_moving_image_blit, 5000),
+    "parallax.update": (case_parallax_update, 20000),
+    "parallax.blit": (case_parallax_blit, 5000),
+    "gameui.show_number": (case_show_number, 20000),
+    "boxlayout.blit": (case_boxlayout_blit, 5000),
+    "game.update[Menu]": (game_update("Menu"), 2000),
+    "game.update[Settings]": (game_update("Settings"), 2000),
+    "game.update[About]": (game_update("About"), 2000),
+    "game.update[play]": (game_update("Start New Game"), 2000),
+    "game.update[gameover]": (game_update("Start New Game", gameover=True), 2000),
+    "game.setup": (case_game_setup, 10),
+}
+
+
+def run_case(op: object, count: int, warmup: int) -> dict:
+    ''':function: time the operation.
+
+        :return dict: ops/s, p50/p99 in micro-seconds and peak bytes of the python heap.
+    '''
+    for _ in range(warmup):
+        op()
+
+    clock = time.perf_counter_ns
+    times = [0] * count
+    start = clock()
+    for index in range(count):
+        begin = clock()
+        op()
+        times[index] = clock() - begin
+    total = (clock() - start) / 1e9
+    times.sort()
+
+    # allocations are measured in a separate run, tracemalloc slows down the operation.
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(min(count, 1000)):
+        op()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {"ops": count / total, "p50": percentile(times, 50) / 1000,
+            "p99": percentile(times, 99) / 1000, "peak": peak}
+
+
+def main():
+    ''':function: entry point of the benchmark suite.'''
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--filter", default="", help="run only the cases containing it")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply the number of operations of each case")
+    parser.add_argument("--baseline", default=BASELINE_FILENAME)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="slowdown in percent reported as a regression")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="run each case several times and keep the fastest run")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    pygame.init()
+    # sounds are still triggered but never mixed, the dummy audio driver crashes now and
+    # then when thousands of sounds are mixed per second.
+    pygame.mixer.set_num_channels(0)
+    game = Game(SCREEN_SIZE, TITLE, seed=0)
+    game.setup()
+
+    baseline = {}
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'case':<26}{'ops/s':>12}{'p50 us':>10}{'p99 us':>10}{'peak B':>10}{'vs base':>10}")
+    for name, (case, count) in CASES.items():
+        if args.filter not in name:
+            continue
+
+        count = max(1, int(count * args.scale))
+        # the fastest run is kept, a slower one only measures the noise of the machine.
+        result = results[name] = min(
+            (run_case(case(game), count, warmup=min(count // 10, 200))
+             for _ in range(max(1, args.repeat))),
+            key=lambda result: result["p50"])
+
+        change = ""
+        if name in baseline:
+            # p50 is compared, it is less noisy than the ops/s of the whole run.
+            percent = (baseline[name]["p50"] / result["p50"] - 1) * 100
+            change = f"{percent:+.1f}%"
+            if percent < -args.threshold:
+                change += "!"
+                regressions.append(name)
+        print(f"{name:<26}{result['ops']:>12.0f}{result['p50']:>10.1f}{result['p99']:>10.1f}"
+              f"{result['peak']:>10}{change:>10}")
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.isfile(args.baseline):
+            with open(args.baseline, "r") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=4)
+        print(f"baseline saved to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold}%: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+'''
+:about: loads the assert of the game in parallel, the files are decoded on a thread pool
+    and the images are converted on the main thread once all of them are decoded. The
+    assert are read from the bundle when one is in use (see :function use_bundle:).
+:class AssetManager: queue, load and keep track of the timing of each assert.
+
+i.e
+assets = AssetManager()
+assets.image("assert/Game Objects/base.png", (640, 112), convert=(True, False))
+assets.sound("hit", "assert/Sound Efects/hit.ogg")
+assets.load(progress=lambda done, total, name: ...)
+base = load_image("assert/Game Objects/base.png", (640, 112), (True, False))  # preloaded
+'''
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+
+# import in-built module/component
+from .utils import preload_image, asset_file, read_asset, load_sound
+
+all = ("AssetManager")
+
+
+class AssetManager:
+    '''
+    :class: loads the images, sounds and text files on a thread pool.
+
+    Note: the images are registered with :function preload_image:, so the next
+    :function load_image: with the same arguments returns them without reading the file.
+    The fonts are not loaded here, the widgets get them on the main thread from the
+    `FONT_POOL`, once per size.
+    '''
+    all = ("image", "sound", "text", "load", "report")
+
+    def __init__(self, workers: int = None):
+        ''':param workers: number of threads, by default depends on the number of cpu.'''
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 2)
+        self._tasks = []
+
+        # loaded assert.
+        self.images = {}
+        self.sounds = {}
+        self.texts = {}
+        # name -> [decode seconds, convert seconds]
+        self.timings = {}
+        self.total_time = 0.0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def image(self, filename: str, scale: tuple[int, int] = None,
+              convert: tuple[bool, bool] = (False, False)) -> None:
+        ''':method: queue an image, same arguments as :function load_image:.'''
+        self._tasks.append(("image", filename, (filename, scale, convert)))
+
+    def sound(self, name: str, filename: str) -> None:
+        ''':method: queue a sound, loaded as `pygame.mixer.Sound`.'''
+        self._tasks.append(("sound", name, filename))
+
+    def text(self, name: str, filename: str) -> None:
+        ''':method: queue a text file.'''
+        self._tasks.append(("text", name, filename))
+
+    @staticmethod
+    def _decode(kind: str, value: object) -> tuple[object, float]:
+        ''':method: internal method, run in a worker thread.
+
+            :return tuple: (decoded assert, seconds)
+        '''
+        start = time.perf_counter()
+
+        if kind == "image":
+            filename, scale, _ = value
+            asset = pygame.image.load(asset_file(filename), filename)
+            if scale:
+                asset = pygame.transform.scale(asset, scale)
+        elif kind == "sound":
+            asset = load_sound(value)
+        else:
+            asset = read_asset(value).decode("utf-8")
+
+        return asset, time.perf_counter() - start
+
+    def load(self, progress: object = None) -> None:
+        ''':method: load all the queued assert.
+
+            :param progress: callable(done, total, name), called on the main thread each
+                time an assert gets decoded, i.e to draw a loading screen.
+        '''
+        start = time.perf_counter()
+        tasks, self._tasks = self._tasks, []
+        total = len(tasks)
+        decoded = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._decode, kind, value): (kind, name, value)
+                       for kind, name, value in tasks}
+
+            for done, future in enumerate(as_completed(futures), 1):
+                kind, name, value = futures[future]
+                asset, seconds = future.result()
+                self.timings[name] = [seconds, 0.0]
+                decoded.append((kind, name, value, asset))
+
+                if progress:
+                    progress(done, total, name)
+
+        # conversion needs the display, so it is done on the main thread.
+        for kind, name, value, asset in decoded:
+            if kind == "image":
+                filename, scale, convert = value
+                convert_start = time.perf_counter()
+                if convert[0]:
+                    asset = asset.convert()
+                elif convert[1]:
+                    asset = asset.convert_alpha()
+                self.timings[name][1] = time.perf_counter() - convert_start
+
+                self.images[value] = asset
+                preload_image(asset, filename, scale, convert)
+            elif kind == "sound":
+                self.sounds[name] = asset
+            else:
+                self.texts[name] = asset
+
+        self.total_time += time.perf_counter() - start
+
+    def report(self) -> str:
+        ''':method: used to get the load timing of each assert, slowest first.'''
+        lines = [f"{'assert':<48}{'decode ms':>10}{'convert ms':>11}"]
+        for name, (decode, convert) in sorted(self.timings.items(),
+                                              key=lambda item: -sum(item[1])):
+            lines.append(f"{name[-48:]:<48}{decode * 1000:>10.2f}{convert * 1000:>11.2f}")
+        lines.append(f"{len(self.timings)} assert loaded in {self.total_time * 1000:.2f} ms "
+                     f"with {self.workers} threads")
+
+        return "\n".join(lines)
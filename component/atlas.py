@@ -0,0 +1,51 @@
+'''
+:about: sprite atlas of the game, the flappy frames, the digits and the UI messages are
+    packed into a single sheet shared by the :class Simulation: and the :class GameUI:.
+:function sprite_atlas: build (once) the atlas of the game data.
+
+regions of the atlas:
+    "yellowbird-0" .. "yellowbird-2": frames of the flappy.
+    "digit-0" .. "digit-9": digits of the score.
+    "message", "gameover": messages of the UI, scaled to the size they are drawn with.
+'''
+# import in-built module/component
+from .utils import load_image, TextureAtlas
+
+all = ("sprite_atlas", "FLAPPY_FRAMES", "DIGITS")
+
+# Constants
+MESSAGE_SIZE = (284, 480)
+GAMEOVER_SIZE = (292, 42)
+# names of the regions.
+FLAPPY_FRAMES = tuple(f"yellowbird-{i}" for i in range(3))
+DIGITS = tuple(f"digit-{i}" for i in range(10))
+
+# atlas already built, keyed by the files and the conversion.
+_atlases = {}
+
+
+def sprite_atlas(data: dict, convert: bool = True) -> TextureAtlas:
+    ''':function: used to get the atlas of the game sprites, built on the first call.
+
+        :param data: game data fetched from the `data.json`.
+        :param convert: if False the sheet is not converted, so that the display is not
+            needed, used it for headless simulation.
+    '''
+    files = (tuple(data["yellowbird"][:3]), tuple(data["ui"]["numbers"][:10]),
+             data["ui"]["message"], data["ui"]["gameover"])
+    key = (files, convert)
+    atlas = _atlases.get(key)
+    if atlas is not None:
+        return atlas
+
+    # same arguments as the assert queued by the game, so the preloaded images are used.
+    images = {}
+    for name, filename in zip(FLAPPY_FRAMES, files[0]):
+        images[name] = load_image(filename, convert=(False, convert))
+    for name, filename in zip(DIGITS, files[1]):
+        images[name] = load_image(filename, convert=(False, convert))
+    images["message"] = load_image(files[2], MESSAGE_SIZE, convert=(False, convert))
+    images["gameover"] = load_image(files[3], GAMEOVER_SIZE, convert=(False, convert))
+
+    atlas = _atlases[key] = TextureAtlas(images, convert=(False, convert))
+    return atlas
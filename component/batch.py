@@ -0,0 +1,216 @@
+'''
+:about: NumPy vectorized simulator, steps thousands of independent games in a single call.
+:class BatchSimulation: keeps the state of N games in arrays and advance them together.
+
+The rules are the same as :method Flappy.update:, :method Flappy.apply_gravity:,
+:method ObsticalControler.update: and :method ObsticalControler.collision:, but instead
+of a sprite and a `pygame.Rect` per entity, every value lives in an array slot:
+    bird_y, ease_*, flap_disabled, ...   -> shape (N,)
+    pipe_x, pipe_gap, pipe_scored        -> shape (N, pipe_count)
+
+Note: only the physics is simulated, the animation and rotation of the flappy are
+visual only and are not part of the batch state.
+
+i.e
+batch = BatchSimulation(4096, seed=1, auto_reset=True)
+scored, hit = batch.step(1 / 60, batch.bird_y > batch.next_gap_center())
+'''
+import numpy as np
+
+all = ("BatchSimulation")
+
+# flappy constants (see :class Flappy:)
+GRAVITY = 200
+MAX_FLIGHT_HEIGHT = 80
+FLIGHT_TIME = 0.3
+FLAP_LOCKOUT = 5
+# center of the flappy after `Game.new_game`, topleft (240, 184) with a 34x24 image.
+BIRD_X = 257
+BIRD_Y = 196
+# size of the flappy collision rect, 34x24 image inflated by (-6, -4).
+BIRD_W = 28
+BIRD_H = 20
+
+# obstical constants (see :class ObsticalControler:)
+PIPE_SPEED = 200
+PIPE_GAP = 100
+PIPE_W = 52
+PIPE_H = 320
+FIRST_PIPE_X = 580
+PIPE_SPACING = (200, 300)
+FIRST_GAP_RANGE = (129, 249)
+RESPAWN_GAP_RANGE = (200 - PIPE_GAP, 205)
+SCORE_X = 320
+SCREEN_W = 640
+
+# top of the base (see `Game.setup`).
+BASE_Y = 368
+
+
+class BatchSimulation:
+    '''
+    :class: simulates N independent games with the state stored in NumPy arrays.
+
+    :param n: number of games.
+    :param pipe_count: number of pipe pairs in each game.
+    :param seed: seed of the random generator.
+    :param auto_reset: if True the game over games are reset at the end of the step.
+    '''
+    all = ("reset", "step", "next_gap_center")
+
+    def __init__(self, n: int, pipe_count: int = 3, seed: int = None,
+                 auto_reset: bool = False):
+        self.n = n
+        self.pipe_count = pipe_count
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        # flappy state.
+        self.bird_y = np.zeros(n)
+        self.easing = np.zeros(n, dtype=bool)
+        self.ease_start = np.zeros(n)
+        self.ease_target = np.zeros(n)
+        self.ease_time = np.zeros(n)
+        # re-flap lockout, flappy can fly again once it falls below `lockout`.
+        self.flap_disabled = np.zeros(n, dtype=bool)
+        self.locked = np.zeros(n, dtype=bool)
+        self.lockout = np.zeros(n)
+
+        # obstical state, `pipe_gap` is the bottom of the top pipe.
+        self.pipe_x = np.zeros((n, pipe_count))
+        self.pipe_gap = np.zeros((n, pipe_count))
+        self.pipe_scored = np.zeros((n, pipe_count), dtype=bool)
+
+        self.score = np.zeros(n, dtype=np.int64)
+        self.alive = np.ones(n, dtype=bool)
+        self.frame = 0
+
+        self.reset()
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def _randint(self, low_high: tuple[int, int], size: int) -> np.ndarray:
+        ''':method: internal method, inclusive random integers like `random.randint`.'''
+        return self.rng.integers(low_high[0], low_high[1] + 1, size=size)
+
+    def reset(self, mask: np.ndarray = None) -> None:
+        ''':method: used to set-up new games.
+
+            :param mask: boolean array of the games to reset, all the games if None.
+        '''
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        index = np.flatnonzero(mask)
+        size = len(index)
+        if not size:
+            return
+
+        self.bird_y[index] = BIRD_Y
+        self.easing[index] = False
+        self.ease_time[index] = 0
+        self.flap_disabled[index] = False
+        self.locked[index] = False
+
+        # same as :method ObsticalControler.generate_pipe:
+        x = np.full(size, FIRST_PIPE_X)
+        for pipe in range(self.pipe_count):
+            x = x + self._randint(PIPE_SPACING, size)
+            self.pipe_x[index, pipe] = x
+            self.pipe_gap[index, pipe] = self._randint(FIRST_GAP_RANGE, size)
+        self.pipe_scored[index] = False
+
+        self.score[index] = 0
+        self.alive[index] = True
+
+    def step(self, delta_time: float, flap: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ''':method: advance all the games which are alive by one step.
+
+            :param delta_time: time of the step in seconds.
+            :param flap: boolean array, True for the games whose flappy flaps.
+
+            :return tuple: (scored, hit) boolean arrays of the step.
+        '''
+        alive = self.alive
+        # game over games are frozen by a zero delta time.
+        dt = delta_time * alive
+
+        # :method Flappy.apply_gravity:
+        self.bird_y += GRAVITY * dt
+
+        # start a flight, the flappy can't fly again until the lockout is over.
+        start = np.asarray(flap, dtype=bool) & ~self.flap_disabled & alive
+        self.flap_disabled |= start
+        self.easing |= start
+        self.ease_start[start] = self.bird_y[start]
+        self.ease_target[start] = self.bird_y[start] - MAX_FLIGHT_HEIGHT
+        self.ease_time[start] = 0
+
+        # ease out sin flight.
+        easing = self.easing
+        self.ease_time[easing] = np.minimum(self.ease_time[easing] + dt[easing], FLIGHT_TIME)
+        percent = self.ease_time[easing] / FLIGHT_TIME
+        self.bird_y[easing] = self.ease_start[easing] + \
+            (self.ease_target[easing] - self.ease_start[easing]) * np.sin(percent * np.pi / 2)
+
+        # flight is over, the lockout starts.
+        done = easing & (self.ease_time >= FLIGHT_TIME)
+        self.easing &= ~done
+        self.locked |= done
+        self.lockout[done] = self.ease_target[done] + FLAP_LOCKOUT
+
+        release = self.locked & (self.bird_y > self.lockout)
+        self.flap_disabled &= ~release
+        self.locked &= ~release
+
+        # :method ObsticalControler.update: all the pipes are moved first, then the ones
+        # out of the screen respawn pipe by pipe, as the respawn depends on the previous pipe.
+        score_before = self.score.copy()
+        self.pipe_x -= PIPE_SPEED * dt[:, None]
+        for pipe in range(self.pipe_count):
+            out = np.flatnonzero(self.pipe_x[:, pipe] + PIPE_W < 0)
+            if len(out):
+                previous_right = self.pipe_x[out, pipe - 1] + PIPE_W
+                offscreen = previous_right > SCREEN_W
+                size = len(out)
+                spacing = self._randint(PIPE_SPACING, size)
+                self.pipe_x[out, pipe] = np.where(offscreen, previous_right, SCREEN_W) + spacing
+                self.pipe_gap[out, pipe] = np.where(offscreen,
+                                                    self._randint(FIRST_GAP_RANGE, size),
+                                                    self._randint(RESPAWN_GAP_RANGE, size))
+                self.pipe_scored[out, pipe] = False
+
+        passed = (self.pipe_x + PIPE_W < SCORE_X) & ~self.pipe_scored
+        self.pipe_scored |= passed
+        self.score += passed.sum(axis=1)
+
+        scored = self.score > score_before
+
+        # :method ObsticalControler.collision: with the flappy collision rect.
+        bird_left = BIRD_X - BIRD_W // 2
+        bird_top = self.bird_y[:, None] - BIRD_H // 2
+        center = self.pipe_x + PIPE_W // 2
+        overlap_x = (center > 0) & (center < SCREEN_W) & \
+                    (bird_left < self.pipe_x + PIPE_W) & (bird_left + BIRD_W > self.pipe_x)
+        top_pipe = (bird_top < self.pipe_gap) & (bird_top + BIRD_H > self.pipe_gap - PIPE_H)
+        bottom_pipe = (bird_top < self.pipe_gap + PIPE_GAP + PIPE_H) & \
+                      (bird_top + BIRD_H > self.pipe_gap + PIPE_GAP)
+        hit = np.any(overlap_x & (top_pipe | bottom_pipe), axis=1)
+
+        # :method MovingImage.collision: with the base.
+        hit |= bird_top[:, 0] + BIRD_H > BASE_Y
+        hit &= alive
+
+        self.alive &= ~hit
+        self.frame += 1
+
+        if self.auto_reset:
+            self.reset(hit)
+
+        return scored, hit
+
+    def next_gap_center(self) -> np.ndarray:
+        ''':method: y center of the gap of the nearest pipe ahead of each flappy.'''
+        ahead = np.where(self.pipe_x + PIPE_W >= BIRD_X - BIRD_W // 2, self.pipe_x, np.inf)
+        nearest = np.argmin(ahead, axis=1)
+        return self.pipe_gap[np.arange(self.n), nearest] + PIPE_GAP / 2
@@ -0,0 +1,151 @@
+'''
+:about: packed assert bundle, all the assert files are packed into a single indexed file
+    which is memory-mapped at runtime, so no file is opened/stat-ed per assert.
+:class AssetBundle: read-only view of a bundle file through `mmap`.
+:function build_bundle: pack the files of a directory into a bundle.
+
+file format (little-endian):
+    header: magic b"FLAB", version (u16), manifest size (u32)
+    manifest: utf-8 json, {"files": {name: [offset, size]}}, offsets are from the start of
+        the body and names are the paths with "/" as separator i.e "assert/UI/gameover.png"
+    body: content of the files, one after another in the order of the manifest.
+
+build the bundle from the root of the project:
+    python -m component.bundle [--root assert] [--output assert.bundle]
+'''
+import io
+import os
+import mmap
+import json
+import struct
+import argparse
+
+all = ("AssetBundle", "build_bundle", "bundle_name")
+
+# Constants
+MAGIC = b"FLAB"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+BUNDLE_FILENAME = "assert.bundle"
+# files which are not packed, the game data is written back by the game.
+EXCLUDE = ("data.json",)
+
+
+def bundle_name(filename: str) -> str:
+    ''':function: name of a file inside the bundle, same on every platform.'''
+    return os.path.normpath(filename).replace(os.sep, "/")
+
+
+def build_bundle(root: str = "assert", output: str = BUNDLE_FILENAME,
+                 exclude: tuple = EXCLUDE) -> dict:
+    ''':function: pack all the files of the root directory into the bundle.
+
+        :param exclude: names of the files which are not packed.
+
+        :return dict: manifest of the bundle.
+    '''
+    filenames = []
+    for path, dirs, files in os.walk(root):
+        dirs.sort()
+        filenames.extend(os.path.join(path, name) for name in sorted(files)
+                         if name not in exclude)
+
+    manifest = {"files": {}}
+    offset = 0
+    for filename in filenames:
+        size = os.path.getsize(filename)
+        manifest["files"][bundle_name(filename)] = [offset, size]
+        offset += size
+    encoded = json.dumps(manifest).encode("utf-8")
+
+    with open(output, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        f.write(encoded)
+        for filename in filenames:
+            with open(filename, "rb") as source:
+                f.write(source.read())
+
+    return manifest
+
+
+class AssetBundle:
+    '''
+    :class: memory-mapped bundle built by :function build_bundle:.
+
+    i.e
+    bundle = AssetBundle("assert.bundle")
+    image = pygame.image.load(bundle.open("assert/UI/gameover.png"), "gameover.png")
+    '''
+    all = ("names", "read", "open", "close")
+
+    def __init__(self, filename: str):
+        ''':raise ValueError: if the file is not a bundle or the version is not supported.'''
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._map) < HEADER.size:
+                raise ValueError(f"{filename}: not an assert bundle")
+            magic, version, manifest_size = HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError(f"{filename}: not an assert bundle")
+            if version != VERSION:
+                raise ValueError(f"{filename}: unsupported bundle version {version}")
+
+            manifest = self._map[HEADER.size:HEADER.size + manifest_size]
+            self.files = json.loads(manifest.decode("utf-8"))["files"]
+            self._body = HEADER.size + manifest_size
+        except ValueError:
+            self._map.close()
+            raise
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, filename: str) -> bool:
+        return bundle_name(filename) in self.files
+
+    def names(self) -> list:
+        ''':method: names of all the files in the bundle.'''
+        return list(self.files)
+
+    def read(self, filename: str) -> bytes:
+        ''':method: content of the file.
+
+            :raise KeyError: if the file is not in the bundle.
+        '''
+        offset, size = self.files[bundle_name(filename)]
+        offset += self._body
+        return self._map[offset:offset + size]
+
+    def open(self, filename: str) -> io.BytesIO:
+        ''':method: file object of the file, can be passed to the pygame loaders.'''
+        offset, size = self.files[bundle_name(filename)]
+        offset += self._body
+        # the content is copied once, straight from the mapping into the file object.
+        with memoryview(self._map) as view, view[offset:offset + size] as content:
+            return io.BytesIO(content)
+
+    def close(self) -> None:
+        ''':method: unmap the bundle.'''
+        self._map.close()
+
+
+def main():
+    ''':function: entry point of the bundle build step.'''
+    parser = argparse.ArgumentParser(description="pack the assert into a bundle")
+    parser.add_argument("--root", default="assert")
+    parser.add_argument("--output", default=BUNDLE_FILENAME)
+    args = parser.parse_args()
+
+    manifest = build_bundle(args.root, args.output)
+    print(f"{len(manifest['files'])} files packed into {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KiB)")
+
+
+if __name__ == '__main__':
+    main()
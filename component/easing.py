@@ -0,0 +1,110 @@
+'''
+:about: easing functions and tween of the game.
+:class Tween: eases a value from start to end over a time, reused in between the tweens.
+:function linear, ease_in_sin, ease_out_sin, ease_in_out_sin, ease_in_quad, ease_out_quad:
+    easing functions, percent (0 to 1) -> eased percent.
+
+i.e
+tween = Tween()
+tween.reset(30, -30, duration=0.2, function=ease_out_sin)
+while not tween.update(delta_time):
+    angle = tween.value
+'''
+import math
+
+all = ("Tween", "linear", "ease_in_sin", "ease_out_sin", "ease_in_out_sin", "ease_in_quad",
+       "ease_out_quad")
+
+# Constants
+HALF_PI = math.pi / 2
+
+
+def linear(percent: float) -> float:
+    ''':function: no easing.'''
+    return percent
+
+
+def ease_in_sin(percent: float) -> float:
+    ''':function: ease in using a sin wave, slow at the start.'''
+    return 1 - math.cos(percent * HALF_PI)
+
+
+def ease_out_sin(percent: float) -> float:
+    ''':function: ease out using a sin wave, slow at the end.'''
+    return math.sin(percent * HALF_PI)
+
+
+def ease_in_out_sin(percent: float) -> float:
+    ''':function: ease in and out using a sin wave, slow at the start and the end.'''
+    return (1 - math.cos(percent * math.pi)) / 2
+
+
+def ease_in_quad(percent: float) -> float:
+    ''':function: quadratic ease in.'''
+    return percent * percent
+
+
+def ease_out_quad(percent: float) -> float:
+    ''':function: quadratic ease out.'''
+    return 1 - (1 - percent) * (1 - percent)
+
+
+class Tween:
+    '''
+    :class: eases a value from start to end over a duration, the tween is reset with new
+    values instead of creating a new one, so no object is allocated per tween.
+
+        :attr value: current value of the tween.
+        :attr active: True from the reset until the tween is done or stopped.
+    '''
+    __slots__ = ("start", "end", "duration", "elapsed", "function", "value", "active")
+
+    def __init__(self):
+        self.start = 0.0
+        self.end = 0.0
+        self.duration = 0.0
+        self.elapsed = 0.0
+        self.function = linear
+        self.value = 0.0
+        self.active = False
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(start={self.start}, end={self.end}, "
+                f"duration={self.duration}, elapsed={self.elapsed}, active={self.active})")
+
+    def reset(self, start: float, end: float, duration: float, function: object = None) -> None:
+        ''':method: start a new tween.
+
+            :param duration: time in seconds to reach the end.
+            :param function: easing function, by default the one of the previous tween.
+        '''
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.elapsed = 0.0
+        if function is not None:
+            self.function = function
+        self.value = start
+        self.active = True
+
+    def stop(self) -> None:
+        ''':method: stop the tween, the value is kept.'''
+        self.active = False
+
+    def update(self, delta_time: float) -> bool:
+        ''':method: advance the tween, the new value is in :attr value:.
+
+            :return bool: True once the tween reached the end.
+        '''
+        self.elapsed += delta_time
+        if self.elapsed >= self.duration:
+            self.elapsed = self.duration
+
+        if self.duration == 0:
+            percent = 1.0
+            self.value = self.end
+        else:
+            percent = self.elapsed / self.duration
+            self.value = self.start + (self.end - self.start) * self.function(percent)
+
+        return percent >= 1.0
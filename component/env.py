@@ -0,0 +1,311 @@
+'''
+:about: environment API of the game, used to drive the game from outside of the
+    `Game.run` event loop i.e by a bot or a reinforcement learning pipeline.
+:class FlappyEnv: `reset(seed)` / `step(action)` environment around the :class Simulation:.
+:class SubprocVectorEnv: shards many environments across worker processes, the
+    observations are exchanged through shared memory.
+
+i.e
+env = FlappyEnv(fetch("assert/data.json"))
+obs = env.reset(seed=1)
+obs, reward, done, info = env.step(1)
+
+Note: both the classes are headless, no display is needed.
+'''
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# import in-built module/component
+from .simulation import Simulation, SimInput
+
+all = ("FlappyEnv", "SubprocVectorEnv")
+
+# Constants
+OBSERVATION_SIZE = 8
+REWARD_ALIVE = 0.1
+REWARD_SCORE = 1.0
+REWARD_DEATH = -1.0
+
+
+class FlappyEnv:
+    '''
+    :class: gym style environment of the game.
+
+    observation (float32 array of :const OBSERVATION_SIZE:):
+        0: y center of the flappy.
+        1: vertical velocity of the flappy (pixel per second, positive is down).
+        2, 3, 4: x distance to the nearest pipe, bottom of its top pipe and top of its
+            bottom pipe (see :method ObsticalControler.nearest:).
+        5, 6, 7: same for the pipe after the nearest one.
+
+    action: 1 to flap, 0 to do nothing.
+    reward: :const REWARD_ALIVE: per step, :const REWARD_SCORE: per score and
+        :const REWARD_DEATH: on game over.
+    '''
+    all = ("reset", "step", "observation", "close")
+
+    def __init__(self, data: dict, delta_time: float = 1 / 60, max_steps: int = None):
+        '''
+        :param data: game data fetched from the `data.json`.
+        :param delta_time: time of each step in seconds.
+        :param max_steps: if passed, the episode gets done after this many steps.
+        '''
+        self.simulation = Simulation.from_data(data, convert=False)
+        self.delta_time = delta_time
+        self.max_steps = max_steps
+        self._inputs = SimInput()
+        self._previous_y = 0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def reset(self, seed: int = None) -> np.ndarray:
+        ''':method: start a new episode.
+
+            :param seed: seed of the pipes, the episode is reproducible with the same seed.
+
+            :return: first observation of the episode.
+        '''
+        self.simulation.reset(seed)
+        self._previous_y = self.simulation.flappy.position.y
+        return self.observation()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        ''':method: advance the game by one step.
+
+            :return tuple: (observation, reward, done, info)
+        '''
+        simulation = self.simulation
+        self._previous_y = simulation.flappy.position.y
+        self._inputs.flap = bool(action)
+        events = simulation.step(self.delta_time, self._inputs)
+
+        reward = REWARD_ALIVE
+        if events.scored:
+            reward += REWARD_SCORE
+        if events.hit:
+            reward = REWARD_DEATH
+
+        done = simulation.gameover
+        truncated = bool(self.max_steps) and simulation.frame >= self.max_steps
+        info = {"score": simulation.obstical.score, "frame": simulation.frame,
+                "truncated": truncated and not done}
+
+        return self.observation(), reward, done or truncated, info
+
+    def observation(self, out: np.ndarray = None) -> np.ndarray:
+        ''':method: build the observation from the flappy and the nearest pipes.
+
+            :param out: if passed, the observation is written into it.
+        '''
+        if out is None:
+            out = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+        flappy = self.simulation.flappy
+        obstical = self.simulation.obstical
+        out[0] = flappy.position.y
+        out[1] = (flappy.position.y - self._previous_y) / self.delta_time
+
+        # pipes whose right side is still ahead of the flappy, nearest first.
+        ahead = obstical.nearest(flappy.collision_rect.left, 2)
+
+        for slot in range(2):
+            index = 2 + slot * 3
+            if slot < len(ahead):
+                pipe = ahead[slot]
+                out[index] = obstical.pipe_x[pipe] - flappy.collision_rect.right
+                out[index + 1] = obstical.gap_y[pipe]
+                out[index + 2] = obstical.gap_y[pipe] + obstical.pipe_gap
+            else:
+                out[index:index + 3] = 0
+
+        return out
+
+    def close(self) -> None:
+        ''':method: release the environment, the observers of the simulation are removed.'''
+        self.simulation.observers.clear()
+
+
+def _worker(connection, names: dict, num_envs: int, start: int, stop: int,
+            data: dict, delta_time: float, max_steps: int) -> None:
+    ''':function: internal function, run the environments [start, stop) in a worker process.
+
+        Commands received through the connection:
+            ("reset", seed) -> reset all the environments of the worker.
+            ("step", None) -> step with the actions of the shared memory, the done
+                environments are reset and their first observation is written.
+            ("close", None) -> exit the worker.
+    '''
+    blocks, arrays = _attach(names, num_envs)
+    obs, rewards, dones, actions = arrays
+    envs = [FlappyEnv(data, delta_time, max_steps) for _ in range(start, stop)]
+
+    try:
+        while True:
+            command, value = connection.recv()
+
+            if command == "reset":
+                for index, env in enumerate(envs, start):
+                    env.reset(None if value is None else value + index)
+                    env.observation(obs[index])
+                connection.send(None)
+
+            elif command == "step":
+                scores = []
+                for index, env in enumerate(envs, start):
+                    _, reward, done, info = env.step(actions[index])
+                    rewards[index] = reward
+                    dones[index] = done
+                    if done:
+                        scores.append((index, info["score"]))
+                        env.reset()
+                    env.observation(obs[index])
+                connection.send(scores)
+
+            elif command == "close":
+                break
+    finally:
+        for env in envs:
+            env.close()
+        del obs, rewards, dones, actions, arrays
+        for block in blocks:
+            block.close()
+        connection.close()
+
+
+def _attach(names: dict, num_envs: int) -> tuple[list, list]:
+    ''':function: internal function, map the shared memory blocks to arrays.'''
+    blocks = []
+    arrays = []
+    for name, (shape, dtype) in _layout(num_envs).items():
+        block = shared_memory.SharedMemory(name=names[name])
+        blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+    return blocks, arrays
+
+
+def _layout(num_envs: int) -> dict:
+    ''':function: internal function, shape and dtype of each shared memory block.'''
+    return {"obs": ((num_envs, OBSERVATION_SIZE), np.float32),
+            "rewards": ((num_envs,), np.float32),
+            "dones": ((num_envs,), np.bool_),
+            "actions": ((num_envs,), np.int8)}
+
+
+class SubprocVectorEnv:
+    '''
+    :class: vectorized environment, shards `num_envs` :class FlappyEnv: across worker
+    processes. The observations, rewards, dones and actions live in shared memory so only
+    the commands go through the pipes.
+
+    Note: the done environments are reset automatically, the observation returned for
+    them is the first observation of the new episode, and their final score is reported
+    in `infos`.
+
+    i.e
+    envs = SubprocVectorEnv(fetch("assert/data.json"), num_envs=64)
+    obs = envs.reset(seed=1)
+    obs, rewards, dones, infos = envs.step(np.ones(64))
+    envs.close()
+    '''
+    all = ("reset", "step", "close")
+
+    def __init__(self, data: dict, num_envs: int, num_workers: int = None,
+                 delta_time: float = 1 / 60, max_steps: int = None, context: str = None):
+        '''
+        :param num_workers: number of worker processes, by default one per cpu.
+        :param context: multiprocessing start method i.e "spawn", "fork".
+        '''
+        self.num_envs = num_envs
+        num_workers = min(num_workers or multiprocessing.cpu_count(), num_envs)
+        ctx = multiprocessing.get_context(context)
+
+        # allocate the shared memory.
+        self._blocks = []
+        names = {}
+        for name, (shape, dtype) in _layout(num_envs).items():
+            size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            self._blocks.append(block)
+            names[name] = block.name
+
+        self.obs, self.rewards, self.dones, self.actions = (
+            np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            for (shape, dtype), block in zip(_layout(num_envs).values(), self._blocks))
+
+        # spawn the workers, each one handles a contiguous slice of environments.
+        self._connections = []
+        self._processes = []
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_worker, daemon=True,
+                                  args=(child, names, num_envs, int(start), int(stop),
+                                        data, delta_time, max_steps))
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        self.closed = False
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def reset(self, seed: int = None) -> np.ndarray:
+        ''':method: reset all the environments, environment `i` is seeded with `seed + i`.
+
+            :return: observations of shape (num_envs, OBSERVATION_SIZE).
+        '''
+        for connection in self._connections:
+            connection.send(("reset", seed))
+        for connection in self._connections:
+            connection.recv()
+
+        return self.obs
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+        ''':method: step all the environments.
+
+            :return tuple: (observations, rewards, dones, infos), the arrays are views of
+                the shared memory and are overwritten by the next step, `infos["scores"]`
+                maps the index of each done environment to its final score.
+        '''
+        self.actions[:] = actions
+        for connection in self._connections:
+            connection.send(("step", None))
+
+        scores = {}
+        for connection in self._connections:
+            scores.update(connection.recv())
+
+        return self.obs, self.rewards, self.dones, {"scores": scores}
+
+    def close(self) -> None:
+        ''':method: stop the workers and release the shared memory.'''
+        if self.closed:
+            return
+
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+
+        del self.obs, self.rewards, self.dones, self.actions
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+        self.closed = True
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
@@ -3,7 +3,9 @@
 :class Flappy: control the flappy entity.
 '''
 import pygame
-from arcade import ease_value, ease_update, ease_out_sin
+
+# import in-built module/component
+from .easing import Tween, ease_out_sin
 
 all = ("Flappy")
 
@@ -12,16 +14,30 @@ class Flappy(pygame.sprite.Sprite):
     '''
     :class: used to draw and control the flappy bird.
     '''
-    all = ("blit", "update", "apply_gravity")
+    all = ("blit", "update", "apply_gravity", "reset", "move_to", "rotated_image",
+           "rotation_bucket", "set_rotation_step")
+
+    # range of the rotation of the flappy in degree.
+    MIN_ROTATE = -30
+    MAX_ROTATE = 30
 
     def __init__(self, flappy_images: list, weight: int, fly_speed: int,
-                 pos: tuple[int, int], **kw):
+                 pos: tuple[int, int], rotation_step: float = 1, **kw):
+        '''
+        :param rotation_step: angle step in degree of the pre-rotated images, the rotation
+            of the flappy is quantized to this step.
+        '''
         super().__init__(**kw)
         # initializing flappy
         self.flappy_images = flappy_images
         self.image = self.flappy_images[0]
         self.rect = self.image.get_rect(center=pos)
         self.collision_rect = self.rect.inflate((-6, -4))
+        '''
+        float center of the flappy, the movement of a step can be less than a pixel so the
+        position is kept here and the rects are derived from it.
+        '''
+        self.position = pygame.math.Vector2(self.rect.center)
 
         # variables
         self.anim = 0  # used for animation
@@ -44,12 +60,13 @@ class Flappy(pygame.sprite.Sprite):
         # maximum height that flappy would allowed to fly
         self.max_flight_height = 80
 
-        # tracking the easing data
-        self.ease_y_data = None
+        # tracking the easing of the flight, the tweens are reset on each flap.
+        self.flight_time = 0.3
+        self.ease_y = Tween()
         # appliying easing in the rotation of flappy
         self.rotate_time = 0.2
-        self.ease_rotate_data = ease_value(30, -30, time=self.rotate_time,
-                                           ease_function=ease_out_sin)
+        self.ease_rotate = Tween()
+        self.ease_rotate.reset(30, -30, self.rotate_time, ease_out_sin)
 
         self.esitmate_flight_height = 0
         # constant gravity for the flappy.
@@ -57,9 +74,86 @@ class Flappy(pygame.sprite.Sprite):
 
         self.lives = 3
 
+        # every images of the flappy pre-rotated once, used instead of rotating each frame.
+        self.rotation_step = None
+        self.set_rotation_step(rotation_step)
+        self._initial_mask = pygame.mask.from_surface(self.image)
+        self.mask = self._initial_mask
+
     def __str__(self):
         return f"{self.__class__}: {self.all}"
 
+    def reset(self) -> None:
+        ''':method: used to reset the flight, rotation and animation of the flappy.'''
+        self.anim = 0
+        self.btn_disable = False
+        self.btn_pressed_delay_timer = 0
+        self.flappy_dir.y = -1
+        self.flappy_rotate = 30
+        self.ease_y.stop()
+        self.ease_rotate.reset(30, -30, self.rotate_time, ease_out_sin)
+        self.esitmate_flight_height = 0
+
+        self.image = self.flappy_images[0]
+        self.mask = self._initial_mask
+        self.rect = self.image.get_rect(center=self.rect.center)
+        self.collision_rect.center = self.rect.center
+
+    def move_to(self, **kw) -> None:
+        ''':method: used to place the flappy, i.e move_to(topleft=(0, 0)).
+
+            kw: position of the rect, any of the `pygame.Rect` attributes.
+        '''
+        for name, value in kw.items():
+            setattr(self.rect, name, value)
+        # a float center is kept as it is, the rect only holds whole pixels.
+        self.position.update(kw["center"] if "center" in kw else self.rect.center)
+        self.collision_rect.center = self.rect.center
+
+    def set_rotation_step(self, rotation_step: float) -> None:
+        ''':method: used to pre-rotate the images of the flappy by the step in degree.'''
+        if rotation_step == self.rotation_step:
+            return
+
+        self.rotation_step = rotation_step
+        self.rotation_atlas = self._build_rotation_atlas()
+        # collision mask of each pre-rotated image, used by the precise collision.
+        self.mask_atlas = [[pygame.mask.from_surface(image) for image in images]
+                           for images in self.rotation_atlas]
+
+    def _build_rotation_atlas(self) -> list:
+        ''':method: internal method, rotate each image of the flappy over the
+            range [MIN_ROTATE, MAX_ROTATE] by the step of :attr rotation_step:.
+
+            :return list: atlas[image_index][angle_index] -> pygame.Surface
+        '''
+        count = round((self.MAX_ROTATE - self.MIN_ROTATE) / self.rotation_step) + 1
+        angles = [self.MIN_ROTATE + self.rotation_step * index for index in range(count)]
+
+        return [[pygame.transform.rotate(image, angle) for angle in angles]
+                for image in self.flappy_images]
+
+    def rotation_bucket(self, angle: float) -> int:
+        ''':method: index of the pre-rotated image nearest to the angle, the angle is
+            clamped to [MIN_ROTATE, MAX_ROTATE].
+        '''
+        bucket = round((angle - self.MIN_ROTATE) / self.rotation_step)
+
+        if bucket < 0:
+            return 0
+        if bucket >= len(self.rotation_atlas[0]):
+            return len(self.rotation_atlas[0]) - 1
+
+        return bucket
+
+    def rotated_image(self, index: int, angle: float) -> pygame.Surface:
+        ''':method: used to get the pre-rotated image nearest to the angle.
+
+            :param index: index of the image of the flappy.
+            :param angle: rotation in degree, clamped to [MIN_ROTATE, MAX_ROTATE].
+        '''
+        return self.rotation_atlas[index][self.rotation_bucket(angle)]
+
     def blit(self, screen: pygame.Surface) -> None:
         ''':method: used to draw the flappy on to the surface.'''
         screen.blit(self.image, self.rect)
@@ -71,55 +165,56 @@ class Flappy(pygame.sprite.Sprite):
 
         if kw["K_SPACE"] and not self.btn_disable:
             self.btn_disable = True
-            self.esitmate_flight_height = self.rect.centery - self.max_flight_height
-            self.ease_y_data = ease_value(self.rect.centery,
-                                          self.esitmate_flight_height,
-                                          time=0.3,
-                                          ease_function=ease_out_sin)
+            self.esitmate_flight_height = self.position.y - self.max_flight_height
+            self.ease_y.reset(self.position.y, self.esitmate_flight_height,
+                              self.flight_time, ease_out_sin)
 
         # flappy can fly with it flying speed, and also it change it direction and rotation
-        if self.ease_y_data:
-            done, self.rect.centery = ease_update(self.ease_y_data, delta_time)
-            # self.rect.centery -= self.speed * delta_time
+        if self.ease_y.active:
+            done = self.ease_y.update(delta_time)
+            self.position.y = self.ease_y.value
             self.flappy_dir.y = 1
             self.flappy_rotate = 30
-            self.ease_rotate_data = None
+            self.ease_rotate.stop()
 
         # flappy reach its limits of flying, and ready for new flight or back to ground
         if done:
             self.flappy_dir.y = -1
-            self.ease_rotate_data = ease_value(30, -30, time=self.rotate_time,
-                                               ease_function=ease_out_sin)
+            self.ease_rotate.reset(30, -30, self.rotate_time)
             self.btn_pressed_delay_timer = self.esitmate_flight_height + 5
-            self.ease_y_data = None
+            self.ease_y.stop()
 
         # flappy take some anticipation to fly again
-        if self.btn_pressed_delay_timer and self.rect.centery > self.btn_pressed_delay_timer:
+        if self.btn_pressed_delay_timer and self.position.y > self.btn_pressed_delay_timer:
             self.btn_disable = False
             self.btn_pressed_delay_timer = 0
 
-        if self.ease_rotate_data:
-            self.flappy_rotate = ease_update(self.ease_rotate_data, delta_time)[1]
+        if self.ease_rotate.active:
+            self.ease_rotate.update(delta_time)
+            self.flappy_rotate = self.ease_rotate.value
 
         self.apply_animation(delta_time)  # applying animation
 
         # finally flappy image gets updated along with rotation to it.
-        self.image = pygame.transform.rotate(self.flappy_images[int(self.anim)],
-                                             self.flappy_rotate)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        index = int(self.anim)
+        bucket = self.rotation_bucket(self.flappy_rotate)
+        self.image = self.rotation_atlas[index][bucket]
+        self.mask = self.mask_atlas[index][bucket]
+        self.rect.size = self.image.get_size()
+        self.rect.center = (round(self.position.x), round(self.position.y))
 
         # update the collision react
         self.collision_rect.center = self.rect.center
 
     def apply_gravity(self, delta_time: float) -> None:
         ''':method: used to apply gravity on the flappy'''
-        self.rect.centery += self.gravity * delta_time
+        self.position.y += self.gravity * delta_time
 
     def apply_animation(self, delta_time: float):
         ''':method: controls the animation of the flappy.'''
 
-        if self.ease_y_data:
-            self.anim = (len(self.flappy_images) - 1)* (self.rect.centery/ self.esitmate_flight_height)
+        if self.ease_y.active:
+            self.anim = (len(self.flappy_images) - 1)* (self.position.y / self.esitmate_flight_height)
         else:
             self.anim += self.anim_speed * delta_time
 
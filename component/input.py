@@ -0,0 +1,135 @@
+'''
+:about: input system of the game, the event queue is consumed once per frame into a bitset
+    of edge-triggered actions, and the clicks are routed to the widgets of the active scene.
+:class InputDispatcher: polls the events, keeps the actions and routes the clicks.
+
+actions (bits of :attr InputDispatcher.actions:):
+    ACTION_FLAP (space), ACTION_PAUSE (p), ACTION_RESTART (r), ACTION_BACK (x),
+    ACTION_PROFILER (F3), ACTION_CONFIRM (return), ACTION_QUIT (escape or closing the window).
+
+i.e
+dispatcher = InputDispatcher()
+dispatcher.poll()  # once per frame
+dispatcher.poll(dispatcher.wait(250))  # or sleep until an event arrives, at most 250 ms
+if dispatcher.pressed(ACTION_FLAP): ...
+dispatcher.route(buttons)  # before drawing the buttons of the scene
+'''
+import pygame
+
+all = ("InputDispatcher", "ACTION_FLAP", "ACTION_PAUSE", "ACTION_RESTART", "ACTION_BACK",
+       "ACTION_PROFILER", "ACTION_CONFIRM", "ACTION_QUIT")
+
+# Constants
+ACTION_FLAP = 1
+ACTION_PAUSE = 2
+ACTION_RESTART = 4
+ACTION_BACK = 8
+ACTION_PROFILER = 16
+ACTION_CONFIRM = 32
+ACTION_QUIT = 64
+
+# key -> action
+KEY_ACTIONS = {pygame.K_SPACE: ACTION_FLAP, pygame.K_p: ACTION_PAUSE,
+               pygame.K_r: ACTION_RESTART, pygame.K_x: ACTION_BACK,
+               pygame.K_F3: ACTION_PROFILER, pygame.K_RETURN: ACTION_CONFIRM,
+               pygame.K_ESCAPE: ACTION_QUIT}
+# action -> name of the shortcut passed to the `Game.update`.
+SHORTCUTS = ((ACTION_FLAP, "K_SPACE"), (ACTION_RESTART, "K_r"), (ACTION_BACK, "K_x"),
+             (ACTION_PAUSE, "K_p"))
+# mouse position while the mouse is out of the window.
+OUTSIDE = (-1, -1)
+
+
+class InputDispatcher:
+    '''
+    :class: consumes the pygame events once per frame.
+
+        :attr actions: bitset of the actions pressed in this frame, an action is only set
+            in the frame its key went down, holding the key does not repeat it.
+        :attr shortcuts: same actions as the dict of booleans taken by the `Game.update`,
+            the dict is updated in place.
+        :attr mouse_pos: last position of the mouse.
+        :attr clicks: positions of the left clicks in this frame.
+        :attr exposed: True if the content of the window got lost in this frame.
+    '''
+    all = ("wait", "poll", "pressed", "route")
+
+    def __init__(self):
+        self.actions = 0
+        self.shortcuts = {name: False for _, name in SHORTCUTS}
+        self.mouse_pos = pygame.mouse.get_pos() if pygame.display.get_init() else OUTSIDE
+        self.clicks = []
+        self.exposed = False
+
+        # widgets routed in the last frame.
+        self._routed = ()
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def wait(self, timeout: int) -> list:
+        ''':method: sleep until an event arrives or the timeout is over.
+
+            :param timeout: milli-seconds.
+
+            :return list: events of the frame, to be passed to :method poll:.
+        '''
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event, *pygame.event.get()]
+
+    def poll(self, events: list = None) -> int:
+        ''':method: consume the events of the frame.
+
+            :param events: events of the frame, by default the pygame event queue.
+
+            :return int: bitset of the actions pressed in this frame.
+        '''
+        actions = 0
+        self.clicks.clear()
+        self.exposed = False
+
+        for event in pygame.event.get() if events is None else events:
+            if event.type == pygame.KEYDOWN:
+                actions |= KEY_ACTIONS.get(event.key, 0)
+            elif event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.mouse_pos = event.pos
+                if event.button == 1:
+                    self.clicks.append(event.pos)
+            elif event.type == pygame.WINDOWLEAVE:
+                self.mouse_pos = OUTSIDE
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.exposed = True
+            elif event.type == pygame.QUIT:
+                actions |= ACTION_QUIT
+
+        self.actions = actions
+        for action, name in SHORTCUTS:
+            self.shortcuts[name] = bool(actions & action)
+
+        return actions
+
+    def pressed(self, action: int) -> bool:
+        ''':method: True if the action is pressed in this frame.'''
+        return bool(self.actions & action)
+
+    def route(self, widgets: tuple) -> None:
+        ''':method: set the focus and the press of the widgets of the active scene, the
+            widgets routed in the last frame and not in this one are released.
+
+            :param widgets: buttons of the scene, see :method Button.set_input:.
+        '''
+        for widget in self._routed:
+            if widget not in widgets:
+                widget.set_input(False, False)
+        self._routed = widgets
+
+        confirm = self.actions & ACTION_CONFIRM
+        for widget in widgets:
+            rect = widget.rect
+            focused = rect.collidepoint(self.mouse_pos)
+            clicked = bool(self.clicks) and any(rect.collidepoint(pos) for pos in self.clicks)
+            widget.set_input(focused, clicked or bool(focused and confirm))
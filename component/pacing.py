@@ -0,0 +1,69 @@
+'''
+:about: frame pacing of the game loop, the end of each frame is a `time.perf_counter`
+    deadline, so an fps whose frame time is not a whole number of milli-seconds (i.e 144)
+    is kept, `pygame.time.Clock.tick` waits in whole milli-seconds.
+:class FramePacer: waits the end of the frame and returns the time of the frame.
+
+i.e
+pacer = FramePacer()
+while running:
+    delta_time = pacer.tick(fps, precise=False)
+'''
+import time
+
+all = ("FramePacer")
+
+# Constants
+# last part of the wait which is spun, a sleep can overshoot by about a milli-second.
+SPIN_TIME = 0.001
+
+
+class FramePacer:
+    '''
+    :class: paces the frames on a deadline, the deadline of the next frame is the one of
+    the current frame plus the frame time, so the rounding of a frame is not carried over
+    to the next ones.
+    '''
+    all = ("tick", "reset")
+
+    def __init__(self):
+        self.deadline = None
+        self.last = time.perf_counter()
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def reset(self) -> None:
+        ''':method: start the pacing again from now, i.e after a long wait.'''
+        self.deadline = None
+        self.last = time.perf_counter()
+
+    def tick(self, fps: int, precise: bool = False) -> float:
+        ''':method: wait the end of the frame.
+
+            :param fps: frames per second, 0 does not wait.
+            :param precise: if True the whole wait is spun instead of sleeping, the frame
+                time is steadier but it burns a core.
+
+            :return float: time in seconds since the previous tick.
+        '''
+        clock = time.perf_counter
+        now = clock()
+
+        if fps:
+            period = 1 / fps
+            deadline = period + (self.last if self.deadline is None else self.deadline)
+            # a late frame starts a new deadline, the next frames don't rush to catch up.
+            if now > deadline:
+                deadline = now
+            self.deadline = deadline
+
+            if not precise and deadline - now > SPIN_TIME:
+                time.sleep(deadline - now - SPIN_TIME)
+            while clock() < deadline:
+                pass
+            now = clock()
+
+        delta_time = now - self.last
+        self.last = now
+        return delta_time
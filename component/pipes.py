@@ -1,23 +1,29 @@
 '''
 :about: This script hold all the obstical and environmental code
 :class Pipe: create the pipe object.
+:class PipePool: creates the pipe objects once and recycles them.
 :class ObsticalControler: control the pipes movement.
 :class MovingImage: controls the environmental movement.
+:class ParallaxScroller: scrolls many layers at their own speed.
 '''
 import pygame
-from random import randint
+import random
 
-all = ("Pipe", "ObsticalControler", "MovingImage")
+import numpy as np
+
+all = ("Pipe", "PipePool", "ObsticalControler", "MovingImage", "ParallaxScroller")
 
 
 class Pipe(pygame.sprite.Sprite):
     ''':class: create the flappy object'''
     all = ("blit")
 
-    def __init__(self, pipe_image: str, pos: tuple[int, int], *args, **kw):
+    def __init__(self, pipe_image: str, pos: tuple[int, int], *args, top: bool = False, **kw):
         super().__init__(*args, **kw)
         self.image = pipe_image
         self.rect = self.image.get_rect(topleft=pos)
+        # True for the pipe hanging from the top of the screen.
+        self.top = top
 
     def __str__(self):
         return f"{self.__class__}: {self.all}"
@@ -27,29 +33,104 @@ class Pipe(pygame.sprite.Sprite):
         screen.blit(self.image, self.rect)
 
 
+class PipePool:
+    '''
+    :class: creates the pipe sprites once and recycles them in between the games.
+
+    Note: all the top pipes share a single flipped surface, and all the bottom pipes share
+    the original surface, so don't draw onto the image of a pipe.
+    '''
+    all = ("acquire", "release")
+
+    def __init__(self, pipe_image: pygame.Surface):
+        self.bottom_image = pipe_image
+        self.top_image = pygame.transform.flip(pipe_image, False, True)
+        # collision masks of each orientation, shared like the surfaces.
+        self.bottom_mask = pygame.mask.from_surface(self.bottom_image)
+        self.top_mask = pygame.mask.from_surface(self.top_image)
+        # free pipes, keyed by `top`.
+        self.free = {True: [], False: []}
+        # number of pipes created by the pool.
+        self.created = 0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def acquire(self, top: bool) -> Pipe:
+        ''':method: used to get a free pipe, a new one is created only if none is free.'''
+        if self.free[top]:
+            return self.free[top].pop()
+
+        self.created += 1
+        pipe = Pipe(self.top_image if top else self.bottom_image, (0, 0), top=top)
+        pipe.mask = self.top_mask if top else self.bottom_mask
+
+        return pipe
+
+    def release(self, *pipes: Pipe) -> None:
+        ''':method: give back the pipes to the pool, once they are removed from the groups.'''
+        for pipe in pipes:
+            pipe.kill()
+            self.free[pipe.top].append(pipe)
+
+
 class ObsticalControler:
     '''
     :class: control the pipe movement as well as check collision with the entity,
     and keep track of score for the game.
+
+    The pipes are stored in arrays, `pipe_x` (left of the pipes), `gap_y` (bottom of the
+    top pipes) and `scored`, used as a ring buffer sorted by x from the slot `head`
+    (leftmost pipe). A pipe leaving the screen is placed after the rightmost one and the
+    head moves to the next slot, so the collision and the score only look at the pipes
+    near the entity whatever the number of pipes.
+
+    Note: the rect of the pipe sprites are derived from the arrays, and only updated
+    while the pipes are on the screen, use :method pipe_positions: to get the position
+    of all the pipes.
     '''
-    all = ("generate_pipe", "update", "collision")
+    all = ("generate_pipe", "update", "collision", "pipe_positions", "nearest")
 
-    def __init__(self, pipe_image: pygame.Surface):
+    SCREEN_WIDTH = 640
+    # x position where the pipes are counted in the score.
+    SCORE_X = 320
+
+    def __init__(self, pipe_image: pygame.Surface, rng: random.Random = None,
+                 pipe_count: int = 3, spacing: tuple[int, int] = (200, 300)):
+        '''
+        :param pipe_count: number of pipe pairs.
+        :param spacing: range of the random distance in between two pipes.
+        '''
         self.pipe_image = pipe_image
+        # pipes are recycled in between the games.
+        self.pool = PipePool(pipe_image)
+        # random generator used to place the pipes, seed it to reproduce a game.
+        self.rng = rng or random.Random()
         self.toppipe = pygame.sprite.Group()
         self.bottompipe = pygame.sprite.Group()
+        self.toppipe_list = []
+        self.bottompipe_list = []
 
         # variables
         self.pipe_speed = 200
         # gap is used to separate the top and bottom pipe
         self.pipe_gap = 100
+        self.pipe_count = pipe_count
+        self.spacing = spacing
+        self.pipe_width, self.pipe_height = pipe_image.get_size()
+
+        # state of the pipes.
+        self.pipe_x = np.zeros(pipe_count)
+        self.gap_y = np.zeros(pipe_count)
+        self.scored = np.zeros(pipe_count, dtype=bool)
+        self.head = 0  # slot of the leftmost pipe
+        self._next_score = 0  # slot of the next pipe to be counted in the score
 
         # generate a pipes with random position
         self.generate_pipe()
 
         self.score = 0
         self.previous_score = self.score
-        self.except_pipe = []  # used to calculate the score
 
     def __str__(self):
         return f"{self.__class__}: {self.all}"
@@ -58,24 +139,23 @@ class ObsticalControler:
         ''':method: used to regenerate the pipes'''
 
         # generating pipes
-        # kill all the pipe sprite if present.
-        self.toppipe.empty()
-        self.bottompipe.empty()
-
-        pipe_pos = [580, 0]
-        for pipe in range(3):
-            pipe_pos[0] += randint(200, 300)
-            pipe_pos[1] = randint(129, 249)  # mid 189
-            toppipe = Pipe(pygame.transform.flip(self.pipe_image, False, True), (0, 0))
-            toppipe.rect.bottomleft = pipe_pos
-            self.toppipe.add(toppipe)
-            bottompipe = Pipe(self.pipe_image.copy(), (0, 0))
-            bottompipe.rect.topleft = (pipe_pos[0], pipe_pos[1] + self.pipe_gap)
-            self.bottompipe.add(bottompipe)
-
-        self.toppipe_list = self.toppipe.sprites()
-        self.bottompipe_list = self.bottompipe.sprites()
-        self.pervious_pipe = None
+        # give back all the pipe sprite to the pool if present.
+        self.pool.release(*self.toppipe_list, *self.bottompipe_list)
+        self.toppipe_list = [self.pool.acquire(top=True) for _ in range(self.pipe_count)]
+        self.bottompipe_list = [self.pool.acquire(top=False) for _ in range(self.pipe_count)]
+        self.toppipe.add(*self.toppipe_list)
+        self.bottompipe.add(*self.bottompipe_list)
+
+        x = 580
+        for pipe in range(self.pipe_count):
+            x += self.rng.randint(*self.spacing)
+            self.pipe_x[pipe] = x
+            self.gap_y[pipe] = self.rng.randint(129, 249)  # mid 189
+
+        self.scored[:] = False
+        self.head = 0
+        self._next_score = 0
+        self._sync_rects(self.pipe_count)
 
     def _custom_pipe_pos(self, toppipe_list: list, bottompipe_list: list) -> None:
         ''':method: internal method assigning a custom position to a pipes.
@@ -83,87 +163,202 @@ class ObsticalControler:
             :param toppipe_list: list of position of the top pipe list.
             :param bottompip_list: list of position of the bottom pipe list.
         '''
-        for pipe in range(len(toppipe_list)):
-            self.toppipe_list[pipe].rect.topleft = toppipe_list[pipe]
-            self.bottompipe_list[pipe].rect.topleft = bottompipe_list[pipe]
+        # slots are filled from the leftmost pipe so the ring stays sorted.
+        positions = sorted(toppipe_list[:self.pipe_count])
+        for pipe, (x, y) in enumerate(positions):
+            self.pipe_x[pipe] = x
+            self.gap_y[pipe] = y + self.pipe_height
+
+        # pipes already passed the center of the screen are not counted again.
+        self.scored[:] = self.pipe_x + self.pipe_width < self.SCORE_X
+        self.head = 0
+        self._next_score = int(np.argmin(self.scored)) if not self.scored.all() else 0
+        self._sync_rects(self.pipe_count)
+
+    def _sync_rects(self, count: int = None) -> None:
+        ''':method: internal method, place the sprites of the pipes from the arrays.
+
+            :param count: number of pipes to place from the head, by default the pipes
+                which are on the screen.
+        '''
+        pipe = self.head
+        for _ in range(count or self.pipe_count):
+            x = round(self.pipe_x[pipe])
+            if count is None and x >= self.SCREEN_WIDTH:
+                break
+            gap_y = int(self.gap_y[pipe])
+            self.toppipe_list[pipe].rect.bottomleft = (x, gap_y)
+            self.bottompipe_list[pipe].rect.topleft = (x, gap_y + self.pipe_gap)
+            pipe = (pipe + 1) % self.pipe_count
+
+    def pipe_positions(self) -> tuple[list, list]:
+        ''':method: used to get the position of all the pipes.
+
+            :return tuple: (topleft of the top pipes, topleft of the bottom pipes)
+        '''
+        toppipe_list = []
+        bottompipe_list = []
+        for pipe in range(self.pipe_count):
+            x = round(self.pipe_x[pipe])
+            gap_y = int(self.gap_y[pipe])
+            toppipe_list.append((x, gap_y - self.pipe_height))
+            bottompipe_list.append((x, gap_y + self.pipe_gap))
+
+        return toppipe_list, bottompipe_list
+
+    def nearest(self, x: float, count: int = 1) -> list:
+        ''':method: used to get the slots of the pipes whose right side is beyond x.
+
+            :param count: maximum number of pipes, nearest first.
+        '''
+        slots = []
+        pipe = self.head
+        for _ in range(self.pipe_count):
+            if len(slots) == count:
+                break
+            if self.pipe_x[pipe] + self.pipe_width >= x:
+                slots.append(pipe)
+            pipe = (pipe + 1) % self.pipe_count
+
+        return slots
 
     def update(self, delta_time: float):
         ''':method: used to update the pipe.'''
 
-        for pipe in range(len(self.toppipe_list)):
-            self.toppipe_list[pipe].rect.x -= self.pipe_speed * delta_time
-            self.bottompipe_list[pipe].rect.x -= self.pipe_speed * delta_time
+        self.pipe_x -= self.pipe_speed * delta_time
 
-            if self.toppipe_list[pipe].rect.right < 0:
-                '''
-                once the pipe is gets bound the screen it gets remove from the list
-                for calculating again. This list is mainly used for calculating score.
-                '''
-                self.except_pipe.remove(self.toppipe_list[pipe])
+        # once the leftmost pipe gets bound the screen it is placed after the rightmost.
+        while self.pipe_x[self.head] + self.pipe_width < 0:
+            pipe = self.head
+            tail_right = self.pipe_x[pipe - 1] + self.pipe_width
 
+            '''
+            If the rightmost pipe is in the area greater than the screen width,
+            than next pipe would respond in some distance from it.
+            '''
+            if tail_right > self.SCREEN_WIDTH:
+                self.pipe_x[pipe] = tail_right + self.rng.randint(*self.spacing)
+                self.gap_y[pipe] = self.rng.randint(129, 249)
+            else:
                 '''
-                If the pipe is respond in the area greater than the screen width,
-                than next pipe would respond in some distance from the previous one.
+                If the rightmost pipe is on the screen, than next pipe would respond
+                just outside of the screen.
+
+                Note: Bottom pipe position are all depend on the top pipe position.
                 '''
-                if self.toppipe_list[pipe - 1].rect.right > 640:
-                    pipe_pos = (self.toppipe_list[pipe - 1].rect.right + randint(200, 300),
-                                randint(129, 249))
-                else:
-                    '''
-                    If the pipe is respond on the screen, than next pipe would respond
-                    just outside of the screen.
+                self.pipe_x[pipe] = self.SCREEN_WIDTH + self.rng.randint(*self.spacing)
+                self.gap_y[pipe] = self.rng.randint(200 - self.pipe_gap, 205)
 
-                    Note: Bottom pipe position are all depend on the top pipe position.
-                    '''
-                    pipe_pos = (640 + randint(200, 300), randint(200 - self.pipe_gap, 205))
+            self.scored[pipe] = False
+            # the sprite stays out of the screen until it is synced again.
+            self.toppipe_list[pipe].rect.bottomleft = (round(self.pipe_x[pipe]),
+                                                       int(self.gap_y[pipe]))
+            self.bottompipe_list[pipe].rect.topleft = (round(self.pipe_x[pipe]),
+                                                       int(self.gap_y[pipe]) + self.pipe_gap)
+            self.head = (pipe + 1) % self.pipe_count
 
-                self.toppipe_list[pipe].rect.bottomleft = pipe_pos
-                self.bottompipe_list[pipe].rect.topleft = (pipe_pos[0], pipe_pos[1] + self.pipe_gap)
+        '''
+        Increase the score each time the entity cross the pipe or pipe cross
+        the center of the screen, only the next pipe not counted is checked.
+        '''
+        pipe = self._next_score
+        while not self.scored[pipe] and self.pipe_x[pipe] + self.pipe_width < self.SCORE_X:
+            self.score += 1
+            self.scored[pipe] = True
+            pipe = (pipe + 1) % self.pipe_count
+        self._next_score = pipe
 
-            '''
-            Increase the score each time the entity cross the pipe or pipe cross
-            the center of the screen.
-            '''
-            if self.toppipe_list[pipe].rect.right < 320 and\
-               self.toppipe_list[pipe] not in self.except_pipe:
-                self.score += 1
-                # once the pipe is used to add score it add to except pipe list.
-                self.except_pipe.append(self.toppipe_list[pipe])
+        self._sync_rects()
 
-    def collision(self, entity: pygame.Rect) -> bool:
-        ''':method: used to detect collision.
+    def collision(self, entity: pygame.Rect, mask: pygame.mask.Mask = None) -> bool:
+        ''':method: used to detect collision, only the pipes overlapping the entity
+            horizontally are checked.
+
+            :param mask: if passed, the collision is pixel perfect, `entity` is then the
+                rect of the mask. Masks are only compared when the rects collide.
 
             :return bool: True if the collision occur else False.
         '''
 
-        collision = False
+        pipe = self.head
+        for _ in range(self.pipe_count):
+            x = self.pipe_x[pipe]
+            if x >= entity.right:
+                break
+
+            centerx = x + self.pipe_width / 2
+            if x + self.pipe_width > entity.left and 0 < centerx < self.SCREEN_WIDTH:
+                for sprite in (self.toppipe_list[pipe], self.bottompipe_list[pipe]):
+                    if sprite.rect.colliderect(entity):
+                        if mask is None or mask.overlap(sprite.mask,
+                                                        (sprite.rect.x - entity.x,
+                                                         sprite.rect.y - entity.y)):
+                            return True
 
-        for pipe in range(len(self.toppipe_list)):
-            if self.toppipe_list[pipe].rect.centerx < 640 and\
-               self.toppipe_list[pipe].rect.centerx > 0:
-                if self.toppipe_list[pipe].rect.colliderect(entity):
-                    collision = True
-                elif self.bottompipe_list[pipe].rect.colliderect(entity):
-                    collision = True
+            pipe = (pipe + 1) % self.pipe_count
 
-        return collision
+        return False
 
 
 class MovingImage:
     ''':class: used to move the images in a desire direction.
+
+    A single surface is scrolled, it is drawn twice per frame, the second time right
+    after the first one along the direction, so the layer wraps around without a copy of
+    the image.
+
+    Note: the topleft of the first tile is kept as a float in :attr position:, the rects
+    of the tiles are derived from it, so a movement of less than a pixel per step is not
+    lost.
     '''
-    all = ("move_image", "collision", "blit")
+    all = ("move_image", "move_to", "collision", "blit", "reset")
 
     def __init__(self, image: pygame.Surface, pos: tuple[int, int]):
-        '''
-        Two images are used for the purpose.
-        '''
-        self.moving_images = {"img1": (image, image.get_rect(topleft=pos)),
-                              "img2": (image.copy(), image.get_rect(topleft=pos))}
+        self.pos = pos
+        self.image = image
+        # rects of the first and the second tile.
+        self.rects = (image.get_rect(topleft=pos), image.get_rect(topleft=pos))
+        # collision mask shared by both the tiles.
+        self.mask = pygame.mask.from_surface(image)
+
+        # float topleft of the first tile.
+        self.position = pygame.math.Vector2(pos)
+        # direction of the last move, the second tile follows the first one along it.
+        self.direction = (0, 0)
+        self._offset = (0, 0)
 
     def __str__(self):
         return f"{self.__class__}: {self.all}"
 
+    def reset(self) -> None:
+        ''':method: place the images back to their starting position.'''
+        self.move_to(self.pos)
+
+    def move_to(self, pos: tuple[float, float]) -> None:
+        ''':method: used to place the first tile, the second one follows it.'''
+        self.position.update(pos)
+        self._place()
+
+    def _set_direction(self, direction: tuple[int, int]) -> None:
+        ''':method: internal method, set the direction and the offset of the second tile
+            from the first one.
+        '''
+        self.direction = direction
+        width, height = self.rects[0].size
+        if direction[0]:
+            self._offset = (-width if direction[0] > 0 else width, 0)
+        elif direction[1]:
+            self._offset = (0, -height if direction[1] > 0 else height)
+        else:
+            self._offset = (0, 0)
+
+    def _place(self) -> None:
+        ''':method: internal method, derive the rects of the tiles from the position.'''
+        rect1, rect2 = self.rects
+        # the rect rounds the float position itself.
+        rect1.topleft = self.position
+        rect2.topleft = (rect1.x + self._offset[0], rect1.y + self._offset[1])
+
     def move_image(self, screen: pygame.Surface, speed: int, delta_time: float,
                    direction: tuple[int, int] = (0, 0)) -> None:
         ''':method: used for moving image along the direction
@@ -172,59 +367,154 @@ class MovingImage:
                 y_dir(-1/1) -> for y direction
             :param speed: speed of moving
         '''
+        if direction != self.direction:
+            self._set_direction(direction)
+            self._place()
+        rect1, rect2 = self.rects
+        position = self.position
+        dx, dy = direction
 
-        # moving image in x direction from left -> right
-        if direction[0] > 0:
-            if self.moving_images["img1"][1].left > 640:
-                self.moving_images = {"img1": self.moving_images["img2"],
-                                      "img2": self.moving_images["img1"]}
+        '''
+        once the first tile is out of the screen, the second tile which follows it
+        becomes the first one, the position wraps by the size of the image.
+        '''
+        # moving image in x direction, left -> right or right -> left
+        if dx:
+            if dx > 0:
+                if rect1.left > 640:
+                    position.x -= rect1.width
+            elif rect1.right < 0:
+                position.x += rect1.width
+
+            position.x += speed * delta_time * dx
+            # only the x of the tiles changes, the rect rounds the float position itself.
+            rect1.x = position.x
+            rect2.x = rect1.x + self._offset[0]
+
+        # moving image in y direction, top -> bottom or bottom -> top
+        elif dy:
+            if dy > 0:
+                if rect1.top > 480:
+                    position.y -= rect1.height
+            elif rect1.bottom < 0:
+                position.y += rect1.height
+
+            position.y += speed * delta_time * dy
+            rect1.y = position.y
+            rect2.y = rect1.y + self._offset[1]
+
+    def blit(self, screen: pygame.Surface, pos: tuple[int, int] = None) -> None:
+        ''':method: used to draw images on the screen
+
+            :param pos: topleft of the first tile, by default its rect, i.e an interpolated
+                position.
 
-            self.moving_images["img1"][1].x += speed * delta_time * direction[0]
-            self.moving_images["img2"][1].right = self.moving_images["img1"][1].left
+            :note: used this method for drawing the moving image.
+        '''
+        x, y = self.rects[0].topleft if pos is None else pos
+        dx, dy = self._offset
+        if dx or dy:
+            screen.blits(((self.image, (x, y)), (self.image, (x + dx, y + dy))),
+                         doreturn=False)
+        else:
+            # not moved yet, both the tiles are at the same place.
+            screen.blit(self.image, (x, y))
+
+    def collision(self, entity: pygame.Rect, mask: pygame.mask.Mask = None) -> bool:
+        ''':method: used for detecting collision
+
+            :param mask: if passed, the collision is pixel perfect, `entity` is then the
+                rect of the mask. Masks are only compared when the rects collide.
+        '''
 
-        # right -> left
-        elif direction[0] < 0:
-            if self.moving_images["img1"][1].right < 0:
-                self.moving_images = {"img1": self.moving_images["img2"],
-                                      "img2": self.moving_images["img1"]}
+        for rect in self.rects:
+            if rect.colliderect(entity):
+                if mask is None or mask.overlap(self.mask, (rect.x - entity.x,
+                                                            rect.y - entity.y)):
+                    return True
 
-            self.moving_images["img1"][1].x += speed * delta_time * direction[0]
-            self.moving_images["img2"][1].left = self.moving_images["img1"][1].right
+        return False
 
-        # moving image in y direction from top -> bottom
-        elif direction[1] > 0:
-            if self.moving_images["img1"][1].top > 480:
-                self.moving_images = {"img1": self.moving_images["img2"],
-                                      "img2": self.moving_images["img1"]}
 
-            self.moving_images["img1"][1].y += speed * delta_time * direction[1]
-            self.moving_images["img2"][1].bottom = self.moving_images["img1"][1].top
+class ParallaxScroller:
+    '''
+    :class: scrolls any number of layers along the same direction, each one at its own
+    speed, they are drawn back to front.
+
+    Consecutive layers with the same speed, size and position are blended into a single
+    layer once when the scroller is created, so they cost a single layer per frame. Only a
+    layer whose pixels are either opaque or fully transparent is blended into the one
+    below it, a translucent pixel blended over another translucent pixel would not give
+    the same color as drawing the layers one after the other.
+
+    Note: the layers of a scroller are drawn together, so a sprite can't be drawn in
+    between them, use a scroller per depth (i.e behind and in front of the sprites).
+
+    i.e
+    scroller = ParallaxScroller([(sky, (0, 0), 10), (hills, (0, 0), 25),
+                                 (trees, (0, 0), 25)], direction=(-1, 0))
+    scroller.update(delta_time)
+    scroller.blit(screen)  # 2 layers drawn, the hills and the trees are blended.
+    '''
+    all = ("update", "blit", "reset")
 
-        # bottom -> top
-        elif direction[1] < 0:
-            if self.moving_images["img1"][1].bottom < 0:
-                self.moving_images = {"img1": self.moving_images["img2"],
-                                      "img2": self.moving_images["img1"]}
+    def __init__(self, layers: list, direction: tuple[int, int] = (-1, 0)):
+        '''
+        :param layers: (image, pos, speed) of each layer, back to front.
+        :param direction: direction of the scroll, see :method MovingImage.move_image:.
+        '''
+        self.direction = direction
+        # (layer, speed) drawn back to front.
+        self.layers = []
+
+        for image, pos, speed in layers:
+            if self.layers:
+                layer, previous_speed = self.layers[-1]
+                if previous_speed == speed and layer.pos == tuple(pos) and \
+                   layer.image.get_size() == image.get_size() and self._binary_alpha(image):
+                    # pre-blended once, the images of the layers are not modified.
+                    blended = layer.image.copy()
+                    blended.blit(image, (0, 0))
+                    self.layers[-1] = (MovingImage(blended, layer.pos), speed)
+                    continue
+
+            self.layers.append((MovingImage(image, tuple(pos)), speed))
+
+        for layer, _ in self.layers:
+            layer._set_direction(direction)
+            layer.reset()
 
-            self.moving_images["img1"][1].y += speed * delta_time * direction[1]
-            self.moving_images["img2"][1].top = self.moving_images["img1"][1].bottom
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
 
-    def blit(self, screen: pygame.Surface) -> None:
-        ''':method: used to draw images on the screen
+    def __len__(self):
+        return len(self.layers)
 
-            :note: used this method for drawing the moving image.
+    @staticmethod
+    def _binary_alpha(image: pygame.Surface) -> bool:
+        ''':method: internal method, True if every pixel of the image is either opaque or
+            fully transparent.
         '''
-        screen.blit(self.moving_images["img1"][0], self.moving_images["img1"][1])
-        screen.blit(self.moving_images["img2"][0], self.moving_images["img2"][1])
+        alpha = image.get_alpha()
+        if alpha is not None and alpha < 255:
+            return False
+        if not image.get_flags() & pygame.SRCALPHA:
+            return True
 
-    def collision(self, entity) -> bool:
-        ''':method: used for detecting collision'''
+        return pygame.mask.from_surface(image, 0).count() == \
+            pygame.mask.from_surface(image, 254).count()
 
-        collision = False
+    def update(self, delta_time: float) -> None:
+        ''':method: used to move every layer by its speed.'''
+        for layer, speed in self.layers:
+            layer.move_image(None, speed, delta_time, self.direction)
 
-        if self.moving_images["img1"][1].colliderect(entity):
-            collision = True
-        if self.moving_images["img2"][1].colliderect(entity):
-            collision = True
-
-        return collision
+    def blit(self, screen: pygame.Surface) -> None:
+        ''':method: used to draw the layers on the screen, back to front.'''
+        for layer, _ in self.layers:
+            layer.blit(screen)
+
+    def reset(self) -> None:
+        ''':method: place the layers back to their starting position.'''
+        for layer, _ in self.layers:
+            layer.reset()
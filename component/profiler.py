@@ -0,0 +1,177 @@
+'''
+:about: frame-time profiler of the game loop, each frame is split into sections and the
+    last frames are kept in a ring buffer, drawn as an overlay and dumped to csv.
+:class FrameProfiler: records the time of each section of the frames.
+
+i.e
+profiler = FrameProfiler()
+profiler.begin_frame()
+...  # poll the events
+profiler.mark("input")
+...  # update the game
+profiler.mark("update")
+profiler.end_frame()
+profiler.draw(screen)  # when visible
+'''
+import csv
+import time
+
+import numpy as np
+import pygame
+
+# import in-built module/component
+from .utils import FONT_POOL
+
+all = ("FrameProfiler", "SECTIONS")
+
+# Constants
+# sections of a frame, in the order they are stacked in the graph.
+SECTIONS = ("input", "update", "draw", "display", "wait")
+SECTION_COLORS = ("#E8E8E8", "#1BABB5", "#F2CACA", "#F5D142", "#5A5A5A")
+SECTION_LABELS = ("in", "upd", "draw", "disp", "wait")
+# frame budget of 60 and 30 fps in milli-seconds, drawn as lines on the graph.
+BUDGETS = (1000 / 60, 1000 / 30)
+GRAPH_SIZE = (240, 80)
+# frame time in milli-seconds at the top of the graph.
+GRAPH_SCALE = 50
+LABEL_INTERVAL = 0.25
+
+
+class FrameProfiler:
+    '''
+    :class: records the time spent in each section of the frames, the frames are kept in
+    a ring buffer of `size` frames.
+
+    Note: time in between two marks goes to the section of the second mark, a section can
+    be marked many times in a frame and the times are summed.
+    '''
+    all = ("begin_frame", "mark", "end_frame", "frames", "averages", "jitter", "draw",
+           "dump_csv")
+
+    def __init__(self, size: int = GRAPH_SIZE[0], pos: tuple[int, int] = (4, 4)):
+        '''
+        :param size: number of frames kept.
+        :param pos: topleft of the overlay on the screen.
+        '''
+        self.size = size
+        # frame -> milli-seconds of each section.
+        self.samples = np.zeros((size, len(SECTIONS)), dtype=np.float64)
+        self.head = 0  # slot of the next frame.
+        self.count = 0  # number of frames recorded, saturates at size.
+        self.total_frames = 0
+
+        self._index = {section: index for index, section in enumerate(SECTIONS)}
+        self._current = [0.0] * len(SECTIONS)
+        self._last = time.perf_counter()
+
+        # overlay
+        self.visible = False
+        self.rect = pygame.Rect(pos, (GRAPH_SIZE[0] + 8, GRAPH_SIZE[1] + 8 + 18 * 2))
+        self._graph = pygame.Surface(GRAPH_SIZE)
+        self._graph.fill("#202020")
+        self._label = None
+        self._label_time = 0.0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return self.count
+
+    def begin_frame(self) -> None:
+        ''':method: start the time of a new frame.'''
+        self._last = time.perf_counter()
+
+    def mark(self, section: str) -> None:
+        ''':method: add the time since the last mark to the section.'''
+        now = time.perf_counter()
+        self._current[self._index[section]] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self) -> None:
+        ''':method: store the frame into the ring buffer.'''
+        current = self._current
+        self.samples[self.head] = current
+        if self.visible:
+            self._draw_column(current)
+
+        for index in range(len(current)):
+            current[index] = 0.0
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.total_frames += 1
+        self._last = time.perf_counter()
+
+    def frames(self) -> np.ndarray:
+        ''':method: recorded frames oldest first, shape (count, len(SECTIONS)).'''
+        if self.count < self.size:
+            return self.samples[:self.count].copy()
+        return np.roll(self.samples, -self.head, axis=0)
+
+    def averages(self) -> dict:
+        ''':method: average milli-seconds of each section over the recorded frames.'''
+        if not self.count:
+            return {section: 0.0 for section in SECTIONS}
+        means = self.frames().mean(axis=0)
+        return {section: float(mean) for section, mean in zip(SECTIONS, means)}
+
+    def jitter(self) -> float:
+        ''':method: standard deviation of the frame time in milli-seconds over the recorded
+            frames, how steady the frame pacing is.
+        '''
+        if self.count < 2:
+            return 0.0
+        return float(self.frames().sum(axis=1).std())
+
+    def _draw_column(self, current: list) -> None:
+        ''':method: internal method, scroll the graph and draw the newest frame on the right.'''
+        graph = self._graph
+        width, height = GRAPH_SIZE
+        graph.scroll(-1, 0)
+        graph.fill("#202020", (width - 1, 0, 1, height))
+
+        bottom = height
+        for value, color in zip(current, SECTION_COLORS):
+            pixels = round(value / GRAPH_SCALE * height)
+            if pixels > 0 and bottom > 0:
+                top = max(bottom - pixels, 0)
+                graph.fill(color, (width - 1, top, 1, bottom - top))
+                bottom = top
+
+        for budget in BUDGETS:
+            graph.set_at((width - 1, height - round(budget / GRAPH_SCALE * height)), "#D94040")
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        ''':method: draw the overlay, fps, jitter, average of each section and the graph.
+
+            :return: rect of the overlay, to be pushed to the display.
+        '''
+        now = time.perf_counter()
+        if self._label is None or now - self._label_time > LABEL_INTERVAL:
+            self._label_time = now
+            averages = self.averages()
+            total = sum(averages.values())
+            # the text changes every time, so it is not kept in the text cache.
+            font = FONT_POOL.get(None, 18)
+            fps = font.render(f"{1000 / total if total else 0:.0f} fps  {total:.1f} ms  "
+                              f"jitter {self.jitter():.2f}", True, "#F5EBEB")
+            sections = font.render(" ".join(f"{label} {averages[section]:.1f}"
+                                            for label, section in zip(SECTION_LABELS, SECTIONS)), True, "#F5EBEB")
+            self._label = (fps, sections)
+
+        screen.fill("#101010", self.rect)
+        x, y = self.rect.x + 4, self.rect.y + 4
+        screen.blits(((self._label[0], (x, y)), (self._label[1], (x, y + 18)),
+                      (self._graph, (x, y + 36))), doreturn=False)
+
+        return self.rect
+
+    def dump_csv(self, filename: str) -> None:
+        ''':method: write the recorded frames, oldest first, into the csv file.'''
+        first = self.total_frames - self.count
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", *SECTIONS, "total"))
+            for index, row in enumerate(self.frames()):
+                writer.writerow((first + index, *(f"{value:.3f}" for value in row),
+                                 f"{row.sum():.3f}"))
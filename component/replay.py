@@ -0,0 +1,251 @@
+'''
+:about: record and replay of the games, a replay keeps the seed of the game and the input
+    of every simulation step, so the game can be simulated again bit-exact.
+:class Replay: seed, step rate and inputs of a game, saved to/loaded from a file.
+:class ReplayRecorder: records the inputs of the game being played.
+:class ReplayPlayer: simulates a replay again, headless or rendered at a speed.
+:function state_checksum: checksum of the state of a simulation.
+
+file format (little-endian):
+    header: magic b"FLRP", version (u16), seed (u64), sim_rate (u16), steps (u32),
+        score (u32), checksum (u32), precise_collision (u8), rotation_step (f64)
+    body: zlib compressed input bits, one byte per step (see :const INPUT_FLAP:).
+'''
+import zlib
+import struct
+
+import pygame
+
+# import in-built module/component
+from .simulation import SimInput, FixedTimestep
+
+all = ("Replay", "ReplayRecorder", "ReplayPlayer", "state_checksum")
+
+# Constants
+MAGIC = b"FLRP"
+VERSION = 2
+HEADER = struct.Struct("<4sHQHIII?d")
+VERSION_HEADER = struct.Struct("<4sH")
+# input bits of a step.
+INPUT_FLAP = 1
+
+
+def state_checksum(simulation: object) -> int:
+    ''':function: crc32 of the float positions of all the moving entities and of the score,
+        two simulations in the same state have the same checksum.
+
+        Note: the rects are not used, they round the positions to whole pixels and would
+        hide a drift of the simulation below a pixel.
+    '''
+    flappy, obstical = simulation.flappy, simulation.obstical
+    values = [*flappy.position, flappy.flappy_rotate, *simulation.background.position,
+              *simulation.base.position]
+
+    checksum = zlib.crc32(struct.pack(f"<{len(values)}d", *values))
+    checksum = zlib.crc32(obstical.pipe_x.astype("<f8").tobytes(), checksum)
+    checksum = zlib.crc32(obstical.gap_y.astype("<f8").tobytes(), checksum)
+    return zlib.crc32(struct.pack("<I", obstical.score), checksum)
+
+
+class Replay:
+    ''':class: all the data required to simulate a game again.'''
+    all = ("save", "load")
+
+    def __init__(self, seed: int, sim_rate: int, inputs: bytearray = None,
+                 score: int = 0, checksum: int = 0, precise_collision: bool = False,
+                 rotation_step: float = 1):
+        self.seed = seed
+        self.sim_rate = sim_rate
+        # settings of the simulation which change its outcome, applied before replaying.
+        self.precise_collision = precise_collision
+        self.rotation_step = rotation_step
+        # one byte of input bits per step.
+        self.inputs = inputs if inputs is not None else bytearray()
+        # final score and state checksum of the recorded game.
+        self.score = score
+        self.checksum = checksum
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, filename: str) -> None:
+        ''':method: used to save the replay into the file.'''
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.sim_rate, len(self.inputs),
+                                self.score, self.checksum, self.precise_collision,
+                                self.rotation_step))
+            f.write(zlib.compress(bytes(self.inputs), 9))
+
+    @classmethod
+    def load(cls, filename: str) -> "Replay":
+        ''':method: used to load the replay from the file.
+
+            :raise ValueError: if the file is not a replay or the version is not supported.
+        '''
+        with open(filename, "rb") as f:
+            header = f.read(HEADER.size)
+            body = f.read()
+
+        # the magic and the version are read first, the header of an other version may
+        # not have the same size.
+        if len(header) < VERSION_HEADER.size:
+            raise ValueError(f"{filename}: not a replay file")
+
+        magic, version = VERSION_HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f"{filename}: not a replay file")
+        if version != VERSION:
+            raise ValueError(f"{filename}: unsupported replay version {version}")
+        if len(header) < HEADER.size:
+            raise ValueError(f"{filename}: replay is truncated")
+
+        (_, _, seed, sim_rate, steps, score, checksum, precise_collision,
+         rotation_step) = HEADER.unpack(header)
+
+        try:
+            inputs = bytearray(zlib.decompress(body))
+        except zlib.error:
+            raise ValueError(f"{filename}: replay is corrupted") from None
+        if len(inputs) != steps:
+            raise ValueError(f"{filename}: replay is truncated")
+
+        return cls(seed, sim_rate, inputs, score, checksum, precise_collision, rotation_step)
+
+
+class ReplayRecorder:
+    '''
+    :class: records the inputs of every simulation step of a game.
+
+    i.e
+    recorder.start(seed, sim_rate, simulation)  # when the game starts from the seed
+    recorder.record(inputs)  # before every step
+    replay = recorder.finish(simulation)  # when the game gets over
+    '''
+    all = ("start", "record", "stop", "finish")
+
+    def __init__(self):
+        self.replay = None
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    @property
+    def active(self) -> bool:
+        '''True while a game is recorded.'''
+        return self.replay is not None
+
+    def start(self, seed: int, sim_rate: int, simulation: object) -> None:
+        ''':method: start recording a game simulated from the seed, with the collision and
+            the rotation settings of the simulation.
+        '''
+        self.replay = Replay(seed, sim_rate, precise_collision=simulation.precise_collision,
+                             rotation_step=simulation.flappy.rotation_step)
+
+    def record(self, inputs: SimInput) -> None:
+        ''':method: record the input of a step.'''
+        if self.replay is not None:
+            self.replay.inputs.append(INPUT_FLAP if inputs.flap else 0)
+
+    def stop(self) -> None:
+        ''':method: stop recording without keeping the replay.'''
+        self.replay = None
+
+    def finish(self, simulation: object) -> Replay:
+        ''':method: stop recording and return the replay with the final state of the game.'''
+        replay = self.replay
+        self.replay = None
+
+        if replay is not None:
+            replay.score = simulation.obstical.score
+            replay.checksum = state_checksum(simulation)
+
+        return replay
+
+
+class ReplayPlayer:
+    '''
+    :class: simulates a replay again from its seed and inputs.
+
+    i.e
+    player = ReplayPlayer(Replay.load(filename), Simulation.from_data(data, convert=False))
+    print(player.run_headless())
+    '''
+    all = ("reset", "advance", "run_headless", "play")
+
+    def __init__(self, replay: Replay, simulation: object):
+        self.replay = replay
+        self.simulation = simulation
+        self.step_time = 1 / replay.sim_rate
+        self.steps = 0
+        self._inputs = SimInput()
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def reset(self) -> None:
+        ''':method: set-up the game from the seed and the settings of the replay.'''
+        self.simulation.precise_collision = self.replay.precise_collision
+        self.simulation.flappy.set_rotation_step(self.replay.rotation_step)
+        self.simulation.reset(self.replay.seed)
+        self.steps = 0
+
+    def advance(self, steps: int) -> bool:
+        ''':method: simulate the next steps of the replay.
+
+            :return bool: True once all the steps of the replay are simulated.
+        '''
+        inputs = self.replay.inputs
+        for _ in range(steps):
+            if self.steps >= len(inputs):
+                break
+            self._inputs.flap = bool(inputs[self.steps] & INPUT_FLAP)
+            self.simulation.step(self.step_time, self._inputs)
+            self.steps += 1
+
+        return self.steps >= len(inputs)
+
+    def run_headless(self) -> dict:
+        ''':method: simulate the whole replay as fast as possible.
+
+            :return dict: score and checksum of the final state, and whether they match
+                the recorded ones.
+        '''
+        self.reset()
+        self.advance(len(self.replay.inputs))
+        checksum = state_checksum(self.simulation)
+
+        return {"steps": self.steps, "score": self.simulation.obstical.score,
+                "checksum": checksum,
+                "match": checksum == self.replay.checksum and
+                self.simulation.obstical.score == self.replay.score}
+
+    def play(self, screen: pygame.Surface, renderer: object, speed: int = 1,
+             fps: int = 60) -> None:
+        ''':method: simulate the replay and draw it on the screen.
+
+            :param renderer: draws the simulation, see :class SimulationRenderer:.
+            :param speed: speed of the replay i.e 1, 4, 16 times faster than real time.
+            :param fps: frame-per-second of the rendering.
+
+            Note: ESC or closing the window stops the replay.
+        '''
+        self.reset()
+        self.simulation.track_previous = True
+        timestep = FixedTimestep(self.replay.sim_rate, max_steps=len(self.replay.inputs))
+        clock = pygame.time.Clock()
+
+        done = False
+        while not done:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or \
+                   (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    return
+
+            # time of the frame is fixed, so no step is skipped on a slow frame.
+            done = self.advance(timestep.advance(speed / fps))
+            renderer.draw(self.simulation, timestep.alpha)
+            pygame.display.update()
+            clock.tick(fps)
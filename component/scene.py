@@ -0,0 +1,177 @@
+'''
+:about: scenes of the game, a scene owns the update and the drawing of one screen of the
+    game and the scenes are kept on a stack, only the top one is updated.
+:class Scene: base class of the scenes, caches its static content into a surface.
+:class SceneStack: stack of the scenes, calls the enter/exit hooks on the changes.
+
+the static content of a scene (background, labels, text...) is drawn once into a cached
+surface, every frame only the buttons which look different than the last frame are drawn
+again over the cached surface, and only their rects are pushed to the display.
+
+i.e
+class MenuScene(Scene):
+    name = "Menu"
+
+    def render_static(self, surface):
+        surface.fill("#383838")
+
+stack = SceneStack()
+stack.push(MenuScene(game))
+stack.top.update(delta_time, kw)
+'''
+import pygame
+
+all = ("Scene", "SceneStack")
+
+
+class Scene:
+    '''
+    :class: base class of the scenes of the game.
+
+        :attr name: name of the scene, used to switch in between the scenes.
+        :attr buttons: buttons of the scene, the input is routed only to them.
+        :attr stacked: if True the scene is pushed over the current scene instead of
+            replacing the whole stack, i.e a menu going back to the previous scene.
+        :attr idle: if True nothing moves on the screen while the scene is active, the game
+            loop sleeps until an input arrives instead of drawing at the full fps.
+
+    Note: override :method update: for the logic of the scene, :method draw: draws the
+    cached surface and the buttons, a scene which draws the whole screen every frame does
+    not call it.
+    '''
+    name = None
+    stacked = False
+    idle = True
+    all = ("enter", "exit", "update", "draw", "render_static", "invalidate")
+
+    def __init__(self, game: object):
+        self.game = game
+        self.buttons = ()
+
+        # cached static content, drawn on first use.
+        self.static = None
+        # True when the whole scene needs to be drawn again on the screen.
+        self._redraw = True
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def enter(self, previous: "Scene") -> None:
+        ''':method: called when the scene becomes the top of the stack.
+
+            :param previous: scene which was on the top, None if the stack was empty.
+        '''
+        self._redraw = True
+
+    def exit(self, next: "Scene") -> None:
+        ''':method: called when the scene is no more the top of the stack.
+
+            :param next: scene which is going to be on the top, None if the stack gets empty.
+        '''
+
+    def update(self, delta_time: float, kw: dict) -> None:
+        ''':method: update the scene, called once per frame while it is on the top.
+
+            :param kw: inputs of the frame, see `Game.update`.
+        '''
+
+    def render_static(self, surface: pygame.Surface) -> None:
+        ''':method: draw the static content of the scene on the surface, the buttons are
+            not part of it.
+        '''
+
+    def invalidate(self) -> None:
+        ''':method: draw the whole scene again on the next :method draw:, i.e something
+            was drawn over it.
+        '''
+        self._redraw = True
+
+    def draw(self, screen: pygame.Surface, display: object) -> None:
+        ''':method: draw the scene, the static content is only drawn when the whole scene
+            needs to be drawn again, otherwise only the changed buttons are drawn.
+
+            :param display: :class DirtyRects: of the game, gets the changed regions.
+        '''
+        if self.static is None:
+            self.static = pygame.Surface(screen.get_size()).convert()
+            self.render_static(self.static)
+
+        if self._redraw:
+            self._redraw = False
+            screen.blit(self.static, (0, 0))
+            for button in self.buttons:
+                button.blit(screen)
+            display.invalidate()
+            return
+
+        for button in self.buttons:
+            if button.changed:
+                # the button is drawn over the static content, not over its last frame.
+                screen.blit(self.static, button.rect, button.rect)
+                button.blit(screen)
+                display.add(button.rect)
+
+
+class SceneStack:
+    '''
+    :class: stack of the scenes, the top scene is the active one.
+
+    Note: :method Scene.enter: and :method Scene.exit: are called each time a scene
+    becomes or stops being the top of the stack, a scene uncovered by a pop enters again.
+    '''
+    all = ("push", "pop", "replace", "reset", "top")
+
+    def __init__(self):
+        self.scenes = []
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.scenes)
+
+    def __contains__(self, scene: Scene) -> bool:
+        return scene in self.scenes
+
+    @property
+    def top(self) -> Scene:
+        ''':method: active scene, None if the stack is empty.'''
+        return self.scenes[-1] if self.scenes else None
+
+    def _change(self, change: object) -> None:
+        ''':method: internal method, apply the change to the stack and call the hooks.'''
+        previous = self.top
+        change()
+        current = self.top
+        if current is previous:
+            return
+
+        if previous is not None:
+            previous.exit(current)
+        if current is not None:
+            current.enter(previous)
+
+    def push(self, scene: Scene) -> None:
+        ''':method: push the scene over the current one.'''
+        self._change(lambda: self.scenes.append(scene))
+
+    def pop(self) -> Scene:
+        ''':method: remove the top scene, the scene below becomes the active one.'''
+        scene = self.top
+        self._change(self.scenes.pop)
+        return scene
+
+    def replace(self, scene: Scene) -> None:
+        ''':method: replace the top scene with the scene.'''
+        def change():
+            if self.scenes:
+                self.scenes.pop()
+            self.scenes.append(scene)
+        self._change(change)
+
+    def reset(self, scene: Scene) -> None:
+        ''':method: remove all the scenes, the scene becomes the only one.'''
+        def change():
+            self.scenes.clear()
+            self.scenes.append(scene)
+        self._change(change)
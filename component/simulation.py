@@ -0,0 +1,387 @@
+'''
+:about: headless simulation core of the game, it advances the flappy, the pipes and
+    the moving environment by one step without touching the display, mixer or fonts.
+:class SimInput: input struct consumed by a single simulation step.
+:class SimEvents: events produced by a single simulation step.
+:class Simulation: advances all the game entities by one step.
+:class FixedTimestep: turns the variable frame time into fixed simulation steps.
+:class SimulationRenderer: optional observer which draws the simulation on a surface.
+
+i.e headless run (no display is needed, images are not converted)
+sim = Simulation.from_data(fetch("assert/data.json"), convert=False)
+sim.run(10000, 1 / 60, policy=lambda sim: sim.flappy.position.y > 250)
+'''
+import pygame
+
+# import in-built module/component
+from .utils import load_image
+from .flappy import Flappy
+from .pipes import ObsticalControler, MovingImage
+from .atlas import sprite_atlas, FLAPPY_FRAMES
+
+all = ("SimInput", "SimEvents", "Simulation", "FixedTimestep", "SimulationRenderer")
+
+# Constants
+SCREEN_SIZE = (640, 480)
+FLAPPY_POS = (320, 184)
+BACKGROUND_SPEED = 50
+BASE_SPEED = 100
+# movement in pixel larger than this in a single step is a teleport (i.e respawn of a pipe
+# or wrap of an image) and is not interpolated.
+MAX_INTERPOLATION_JUMP = 100
+
+
+class SimInput:
+    ''':class: input struct for one simulation step.
+
+        :attr flap: True when the flappy is asked to flap its wings.
+    '''
+    __slots__ = ("flap",)
+
+    def __init__(self, flap: bool = False):
+        self.flap = flap
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(flap={self.flap})"
+
+    @classmethod
+    def from_shortcuts(cls, shortcuts: dict) -> "SimInput":
+        ''':method: build the input from the `ShortCuts` dict used by the game loop.'''
+        return cls(flap=shortcuts["K_SPACE"])
+
+
+class SimEvents:
+    ''':class: events produced by one simulation step.
+
+        :attr flapped: the flap input was applied in this step.
+        :attr scored: the score got increased in this step.
+        :attr hit: the flappy collide with a pipe or with the base in this step.
+    '''
+    __slots__ = ("flapped", "scored", "hit")
+
+    def __init__(self):
+        self.clear()
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(flapped={self.flapped}, "
+                f"scored={self.scored}, hit={self.hit})")
+
+    def clear(self) -> None:
+        ''':method: reset all the events.'''
+        self.flapped = False
+        self.scored = False
+        self.hit = False
+
+
+class Simulation:
+    '''
+    :class: pure simulation core of the game, it owns the flappy, the obsticals and the
+    moving environment and advance them by one step from a :class SimInput:.
+
+    Note: no display, mixer or font calls are made from this class, so it can run under
+    the SDL dummy drivers. Rendering is done by the observers added with
+    :method add_observer:, see :class SimulationRenderer:.
+    '''
+    all = ("from_data", "add_observer", "remove_observer", "reset", "step", "run",
+           "moving_rects")
+
+    def __init__(self, flappy: Flappy, obstical: ObsticalControler,
+                 background: MovingImage, base: MovingImage):
+        self.flappy = flappy
+        self.obstical = obstical
+        self.background = background
+        self.base = base
+
+        self.gameover = False
+        self.frame = 0
+
+        '''
+        if True, the collision is pixel perfect with the pre-computed masks, otherwise
+        the hand-tuned collision rect of the flappy is used.
+        '''
+        self.precise_collision = False
+
+        '''
+        if True, the float positions before the last step are copied into the buffers
+        below, used for render interpolation. The buffers are allocated once and
+        :attr has_previous: tells whether they hold a step.
+        '''
+        self.track_previous = False
+        self.has_previous = False
+        self.previous_flappy = pygame.math.Vector2()
+        self.previous_background = pygame.math.Vector2()
+        self.previous_base = pygame.math.Vector2()
+        self.previous_pipe_x = obstical.pipe_x.copy()
+
+        # events are reused in between the steps to avoid allocations.
+        self.events = SimEvents()
+        self.observers = []
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    @classmethod
+    def from_data(cls, data: dict, convert: bool = True) -> "Simulation":
+        ''':method: create the simulation from the game data.
+
+            :param data: game data fetched from the `data.json`.
+            :param convert: if False the images are not converted, so that the display
+                is not needed, used it for headless simulation.
+        '''
+        flappy_images = sprite_atlas(data, convert).images(FLAPPY_FRAMES)
+        flappy = Flappy(flappy_images=flappy_images, weight=data["entity"]["weight"],
+                        fly_speed=data["entity"]["fly_speed"], pos=FLAPPY_POS,
+                        rotation_step=data.get("rotation_step", 1))
+
+        obstical = ObsticalControler(load_image(data["game_objects"]["pipe-green"],
+                                                convert=(convert, False)))
+
+        background = MovingImage(load_image(data["game_objects"]["background-day"],
+                                            SCREEN_SIZE, (convert, False)), (0, 0))
+        base = MovingImage(load_image(data["game_objects"]["base"], (640, 112),
+                                      convert=(convert, False)), (0, 368))
+
+        simulation = cls(flappy, obstical, background, base)
+        simulation.precise_collision = data.get("precise_collision", False)
+
+        return simulation
+
+    def add_observer(self, observer: object) -> None:
+        ''':method: add an observer, `observer.on_step(simulation, events)` gets called
+            after every step.
+        '''
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: object) -> None:
+        ''':method: remove the observer added by :method add_observer:.'''
+        self.observers.remove(observer)
+
+    def reset(self, seed: int = None) -> None:
+        ''':method: used to set-up new game.
+
+            :param seed: if passed the pipes are placed from this seed.
+        '''
+        if seed is not None:
+            self.obstical.rng.seed(seed)
+        self.obstical.generate_pipe()
+        self.obstical.score = 0
+        self.obstical.previous_score = self.obstical.score
+
+        self.flappy.reset()
+        self.flappy.move_to(topleft=(480 // 2, 368 // 2))
+        self.background.reset()
+        self.base.reset()
+        self.gameover = False
+        self.frame = 0
+        self.has_previous = False
+
+    def moving_rects(self) -> list:
+        ''':method: rects of all the entities which moves in a step.'''
+        rects = [self.flappy.rect]
+        rects.extend(pipe.rect for pipe in self.obstical.toppipe_list)
+        rects.extend(pipe.rect for pipe in self.obstical.bottompipe_list)
+        rects.extend(self.background.rects)
+        rects.extend(self.base.rects)
+
+        return rects
+
+    def step(self, delta_time: float, inputs: SimInput) -> SimEvents:
+        ''':method: advance the whole simulation by one step.
+
+            :param delta_time: time of the step in seconds.
+            :param inputs: input applied in this step.
+
+            :return SimEvents: events of the step, the object is reused by the next step.
+        '''
+        events = self.events
+        events.clear()
+
+        if self.gameover:
+            return events
+
+        if self.track_previous:
+            self.previous_flappy.update(self.flappy.position)
+            self.previous_background.update(self.background.position)
+            self.previous_base.update(self.base.position)
+            self.previous_pipe_x[:] = self.obstical.pipe_x
+            self.has_previous = True
+
+        # update all the entities.
+        self.background.move_image(None, BACKGROUND_SPEED, delta_time, (-1, 0))
+        self.flappy.update(delta_time, K_SPACE=inputs.flap)
+        self.obstical.update(delta_time)
+        self.base.move_image(None, BASE_SPEED, delta_time, (-1, 0))
+
+        events.flapped = inputs.flap
+
+        # check collision of entity with the pipes and with the base.
+        if self.precise_collision:
+            entity, mask = self.flappy.rect, self.flappy.mask
+        else:
+            entity, mask = self.flappy.collision_rect, None
+
+        if self.obstical.collision(entity, mask) or self.base.collision(entity, mask):
+            events.hit = True
+            self.gameover = True
+
+        if self.obstical.score > self.obstical.previous_score:
+            events.scored = True
+            self.obstical.previous_score = self.obstical.score
+
+        self.frame += 1
+
+        for observer in self.observers:
+            observer.on_step(self, events)
+
+        return events
+
+    def run(self, frames: int, delta_time: float, policy: object = None) -> int:
+        ''':method: run the simulation as fast as possible until the game get over.
+
+            :param frames: maximum number of steps.
+            :param delta_time: time of each step in seconds.
+            :param policy: callable(simulation) -> bool, return True to flap.
+
+            :return int: number of steps done.
+        '''
+        inputs = SimInput()
+        for frame in range(frames):
+            if self.gameover:
+                return frame
+            inputs.flap = bool(policy(self)) if policy else False
+            self.step(delta_time, inputs)
+
+        return frames
+
+
+class FixedTimestep:
+    '''
+    :class: accumulator which turns the variable time of the frames into a whole number of
+    fixed simulation steps, so the simulation does not depend on the frame rate.
+
+    i.e
+    timestep = FixedTimestep(rate=120)
+    for _ in range(timestep.advance(clock.tick(fps) / 1000)):
+        simulation.step(timestep.step, inputs)
+    renderer.draw(simulation, timestep.alpha)
+    '''
+    all = ("advance", "reset")
+
+    def __init__(self, rate: int = 120, max_steps: int = 8):
+        '''
+        :param rate: number of simulation steps per second.
+        :param max_steps: maximum steps per frame, the time of the frame beyond it is
+            dropped so a slow frame can't make the next one slower (spiral of death).
+        '''
+        self.rate = rate
+        self.step = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        # total simulation time dropped by the spiral of death guard.
+        self.dropped = 0.0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    @property
+    def alpha(self) -> float:
+        '''fraction of a step left in the accumulator, used for the render interpolation.'''
+        return self.accumulator / self.step
+
+    def advance(self, delta_time: float) -> int:
+        ''':method: add the time of the frame to the accumulator.
+
+            :return int: number of steps to run in this frame.
+        '''
+        self.accumulator += delta_time
+        steps = int(self.accumulator / self.step)
+
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.dropped += dropped
+            self.accumulator -= dropped
+
+        self.accumulator -= steps * self.step
+        if self.accumulator < 0:
+            self.accumulator = 0.0
+
+        return steps
+
+    def reset(self) -> None:
+        ''':method: empty the accumulator.'''
+        self.accumulator = 0.0
+
+
+class SimulationRenderer:
+    '''
+    :class: draw the simulation on a surface, used as an observer of the
+    :class Simulation: or called directly through :method draw:.
+    '''
+    all = ("draw", "on_step")
+
+    def __init__(self, screen: pygame.Surface, gameui: object = None):
+        self.screen = screen
+        # used to draw the score, if None the score is not drawn.
+        self.gameui = gameui
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def draw(self, simulation: Simulation, alpha: float = 1.0) -> None:
+        ''':method: draw all the entities of the simulation.
+
+            :param alpha: fraction in between the state before the last step (0) and the
+                current state (1), used when :attr Simulation.track_previous: is True.
+        '''
+        if alpha >= 1.0 or not simulation.has_previous:
+            simulation.background.blit(self.screen)
+            simulation.flappy.blit(self.screen)
+            simulation.obstical.toppipe.draw(self.screen)
+            simulation.obstical.bottompipe.draw(self.screen)
+            simulation.base.blit(self.screen)
+        else:
+            screen = self.screen
+            interpolate = self._interpolate
+            flappy, obstical = simulation.flappy, simulation.obstical
+
+            background, base = simulation.background, simulation.base
+            background.blit(screen, interpolate(simulation.previous_background,
+                                                background.position, alpha))
+
+            # the image is drawn around the interpolated center, like the rect is placed.
+            x, y = interpolate(simulation.previous_flappy, flappy.position, alpha)
+            rect = flappy.rect
+            screen.blit(flappy.image, (rect.x + x - rect.centerx, rect.y + y - rect.centery))
+
+            # only the x of the pipes moves, the y is the one of their sprite.
+            previous_x, pipe_x = simulation.previous_pipe_x, obstical.pipe_x
+            for pipe in range(obstical.pipe_count):
+                x = self._interpolate_axis(float(previous_x[pipe]), float(pipe_x[pipe]), alpha)
+                for sprite in (obstical.toppipe_list[pipe], obstical.bottompipe_list[pipe]):
+                    screen.blit(sprite.image, (x, sprite.rect.y))
+
+            base.blit(screen, interpolate(simulation.previous_base, base.position, alpha))
+
+        if self.gameui:
+            self.gameui.show_number(self.screen, simulation.obstical.score)
+
+    @staticmethod
+    def _interpolate_axis(previous: float, current: float, alpha: float) -> int:
+        ''':method: internal method, position on an axis in between the last two steps.'''
+        delta = current - previous
+        if abs(delta) > MAX_INTERPOLATION_JUMP:
+            return round(current)
+
+        return round(previous + delta * alpha)
+
+    @classmethod
+    def _interpolate(cls, previous: pygame.math.Vector2, current: pygame.math.Vector2,
+                     alpha: float) -> tuple[int, int]:
+        ''':method: internal method, position in between the last two steps.'''
+        return (cls._interpolate_axis(previous.x, current.x, alpha),
+                cls._interpolate_axis(previous.y, current.y, alpha))
+
+    def on_step(self, simulation: Simulation, events: SimEvents) -> None:
+        ''':method: called by the simulation after every step.'''
+        self.draw(simulation)
@@ -2,13 +2,76 @@
 :about: controls and setup all UI for the game.
 
 :class: GameUI: controls and set the UI for the game.
+:class: NumberDisplay: draws a number with the digit images.
 '''
 import pygame
 
 # import in-build module
-from .utils import load_image, Label, Button, BoxLayout
+from .utils import Label, Button, BoxLayout
+from .atlas import sprite_atlas, DIGITS
 
-all = ("GameUI")
+all = ("GameUI", "NumberDisplay", "FPS_OPTIONS")
+
+# Constants
+# fps offered by the settings, 0 is uncapped.
+FPS_OPTIONS = (30, 60, 120, 144, 240, 0)
+
+
+class NumberDisplay:
+    '''
+    :class: draws a number with the digit images, the digits are composited into a
+    single surface only when the number changes so each frame is a single blit.
+    '''
+    all = ("set_number", "blit")
+
+    def __init__(self, digit_images: list, pos: tuple[int, int], spacing: int = 24):
+        '''
+        :param digit_images: images of the digits 0 to 9.
+        :param pos: position of the last digit of a single digit number, each digit
+            added shifts the number by the spacing to the left.
+        :param spacing: horizontal distance in between the digits.
+        '''
+        self.digit_images = digit_images
+        self.pos = pos
+        self.spacing = spacing
+        self.height = max(image.get_height() for image in digit_images)
+
+        self.number = None
+        self.image = None
+        self.rect = None
+        self.set_number(0)
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def set_number(self, number: int) -> None:
+        ''':method: composite the digits of the number, nothing is done if the number
+            is not changed.
+        '''
+        if number == self.number:
+            return
+        self.number = number
+
+        # digits from the right to the left.
+        digits = []
+        number = abs(number)
+        while True:
+            number, digit = divmod(number, 10)
+            digits.append(digit)
+            if not number:
+                break
+
+        width = self.spacing * (len(digits) - 1) + self.digit_images[digits[0]].get_width()
+        self.image = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        self.image.blits([(self.digit_images[digit], (self.spacing * index, 0))
+                          for index, digit in enumerate(reversed(digits))], doreturn=False)
+
+        self.rect = self.image.get_rect(topleft=(self.pos[0] - self.spacing * (len(digits) - 1),
+                                                 self.pos[1]))
+
+    def blit(self, screen: pygame.Surface) -> None:
+        ''':method: draw the number on the screen.'''
+        screen.blit(self.image, self.rect)
 
 
 class GameUI:
@@ -16,8 +79,7 @@ class GameUI:
     :class: controls and setup all the UI asserts and functionality for the game.
     '''
     all = ("start_message", "gameover_message", "show_number", "setup_gamemenu",
-               "show_gamemenu", "setup_settingmenu", "show_settingmenu", "show_highscore",
-               "show_about_btn")
+               "setup_settingmenu", "show_highscore")
 
     GAMEFONT = None
     GAMEFONTSIZE = 40
@@ -26,17 +88,15 @@ class GameUI:
     def __init__(self, data: dict):
         self._gamedata = data
         GameUI.GAMEFONT = data["font"]["gamefont"]
-        # load all the UI assert
-        self.start_message_img = load_image(data["ui"]["message"], (284, 480),
-                                            convert=(False, True))
-        self.gameover_message_img = load_image(data["ui"]["gameover"], (292, 42),
-                                               convert=(False, True))
+        # load all the UI assert, all of them are regions of the sprite atlas.
+        self.atlas = sprite_atlas(data)
+        self.start_message_img = self.atlas.image("message")
+        self.gameover_message_img = self.atlas.image("gameover")
 
         # load numbers for the game.
-        self.number_image = []
-        for i in range(10):
-            self.number_image.append(load_image(data["ui"]["numbers"][i],
-                                                convert=(False, True)))
+        self.number_image = self.atlas.images(DIGITS)
+        # numbers are separated horizontally with 24 pixel a part.
+        self.score_display = NumberDisplay(self.number_image, (320, 0), spacing=24)
 
         # load widget for the game
         self.restart_font = Label("Press R to restart", (175, 250), fontname=GameUI.GAMEFONT,
@@ -48,6 +108,12 @@ class GameUI:
                                 fontname=GameUI.GAMEFONT,
                                 fontcolor="#1BABB5", focuscolor="#E8E8E8")
 
+        # high-score label is only created again when the high-score changes.
+        self._highscore_label = None
+        self._highscore = None
+        # last message shown at each position, pos -> (message, kw, label).
+        self._messages = {}
+
         # calling in-class functions
         self.setup_gamemenu()
         self.setup_settingmenu()
@@ -58,26 +124,22 @@ class GameUI:
 
     def start_message(self, screen: pygame.Surface) -> None:
         ''':method: used to show start message'''
-        screen.blit(self.start_message_img, (158, 0))
+        self.atlas.blit(screen, "message", (158, 0))
 
     def gameover_message(self, screen: pygame.Surface) -> None:
         '''method: show game over UI, play again and back button'''
 
-        screen.blit(self.gameover_message_img, (175, 198))
-        screen.blit(self.restart_font.img, self.restart_font.rect)
-        screen.blit(self.back_font.img, self.back_font.rect)
+        screen.blits(((self.atlas.sheet, (175, 198), self.atlas.regions["gameover"]),
+                      (self.restart_font.img, self.restart_font.rect),
+                      (self.back_font.img, self.back_font.rect)), doreturn=False)
 
-    def show_number(self, screen: pygame.Surface, number: str) -> None:
-        ''':method: used to show the score over the screen'''
+    def show_number(self, screen: pygame.Surface, number: int) -> None:
+        ''':method: used to show the score over the screen
 
-        pos = (320 - (24 * len(number)), 0)
-        count = 1
-        '''
-        numbers are separated horizontally with 24 pixel a part.
+            Note: the digits are composited again only when the number changes.
         '''
-        for num in number:
-            screen.blit(self.number_image[eval(num)], (pos[0] + (24 * count), pos[1]))
-            count += 1
+        self.score_display.set_number(number)
+        self.score_display.blit(screen)
 
     def setup_gamemenu(self) -> None:
         ''':method: used to setup start-game-menu stuff'''
@@ -98,35 +160,41 @@ class GameUI:
 
         fps_label = Label("FPS", (0, 100), fontsize=32, fontname=GameUI.GAMEFONT,
                           fontcolor="#F5EBEB")
-        fps_30_btn = Button("30", (0, 100), fontsize=32, fontname=GameUI.GAMEFONT,
-                            fontcolor="#F5EBEB", focuscolor="#E8E8E8")
-        fps_60_btn = Button("60", (0, 100), fontsize=32, fontname=GameUI.GAMEFONT,
-                            fontcolor="#F5EBEB", focuscolor="#E8E8E8")
+        # fps button -> fps of the game, 0 is uncapped.
+        self.fps_buttons = [(Button(str(fps) if fps else "Max", (0, 100), fontsize=32,
+                                    fontname=GameUI.GAMEFONT, fontcolor="#F5EBEB",
+                                    focuscolor="#E8E8E8"), fps) for fps in FPS_OPTIONS]
 
         # creating a box layout for auto alignment
         self.settingmenu_boxlayout_1 = BoxLayout((640, 480), spacing=5, orientation="horizontal")
-        self.settingmenu_boxlayout_1.add(fps_label, fps_30_btn, fps_60_btn)
+        self.settingmenu_boxlayout_1.add(fps_label, *(btn for btn, _ in self.fps_buttons))
 
-    def show_gamemenu(self, screen: pygame.Surface) -> None:
-        ''':method: used to display game-menu into the screen'''
-        self.gamemenu_boxlayout.blit(screen)
+        pacing_label = Label("Pacing", (0, 160), fontsize=32, fontname=GameUI.GAMEFONT,
+                             fontcolor="#F5EBEB")
+        # pacing button -> precise pacing, see :class FramePacer:.
+        self.pacing_buttons = [(Button(text, (0, 160), fontsize=32, fontname=GameUI.GAMEFONT,
+                                       fontcolor="#F5EBEB", focuscolor="#E8E8E8"), precise)
+                               for text, precise in (("Sleep", False), ("Precise", True))]
 
-    def show_settingmenu(self, screen: pygame.Surface) -> None:
-        ''':method: used to display settings-menu into the screen'''
-        self.settingmenu_boxlayout_1.blit(screen)
+        self.settingmenu_boxlayout_2 = BoxLayout((640, 480), spacing=5, orientation="horizontal")
+        self.settingmenu_boxlayout_2.add(pacing_label, *(btn for btn, _ in self.pacing_buttons))
 
     def show_highscore(self, screen: pygame.Surface, score: int) -> None:
         ''':method: used to display high-score into the screen'''
-        score = Label(f"High Score: {score}", (175, 150), fontname=GameUI.GAMEFONT,
-                      fontcolor="#F5EBEB")
-        score.blit(screen)
-
-    def show_about_btn(self, screen: pygame.Surface) -> None:
-        ''':method: used to display about text into the screen'''
-        self.about_btn.blit(screen)
+        if score != self._highscore:
+            self._highscore = score
+            self._highscore_label = Label(f"High Score: {score}", (175, 150),
+                                          fontname=GameUI.GAMEFONT, fontcolor="#F5EBEB")
+        self._highscore_label.blit(screen)
 
     def show_message(self, message: str, screen: pygame.Surface,
                      pos: tuple[int, int], **kw) -> None:
-        ''':method: used to display message over the screen'''
-        message = Label(message, pos, **kw)
-        message.blit(screen)
+        ''':method: used to display message over the screen
+
+            Note: the label of a position is only created again when its message or style
+            changes, the rendered text is cached, see :class TextCache:.
+        '''
+        cached = self._messages.get(pos)
+        if cached is None or cached[0] != message or cached[1] != kw:
+            cached = self._messages[pos] = (message, kw, Label(message, pos, **kw))
+        cached[2].blit(screen)
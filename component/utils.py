@@ -6,16 +6,31 @@
 :class: Button: used to display button on the screen.
 :class: Boxlayout: used to align widgets horizontal and vertical order.
 :class: TextBox: used display multi line text on the screen.
+:class: FontPool: process wide pool of pygame font objects.
+:class: TextCache: LRU cache of rendered text surfaces.
+:class: DirtyRects: pushes only the changed regions of the screen to the display.
+:class: TextureAtlas: packs many images into a single surface with named regions.
 
 :function: fetch: used to fetch json data from the .json file.
 :function: save: used to save json data to a .json file.
 :function: load_image: used to load image and convert those image into pygame image.
+:function: preload_image: used to register an image already loaded for the load_image.
+:function: use_bundle: used to load the assert from a packed bundle instead of the files.
+:function: asset_file: used to get the file of an assert, from the bundle if any.
+:function: load_sound: used to load sound from file.
+:function: extract_image_from_spritesheet: used to slice a sprite-sheet into images.
 '''
 import pygame
 import json
+from collections import OrderedDict
 
-all = ("fetch", "save", "load_image", "Text", "SysFont", "Label", "Button",
-           "BoxLayout", "Text")
+# import in-built module/component
+from .bundle import AssetBundle
+
+all = ("fetch", "save", "load_image", "preload_image", "use_bundle", "asset_file",
+           "read_asset", "load_sound", "Text", "SysFont", "Label", "Button",
+           "BoxLayout", "Text", "FontPool", "TextCache", "FONT_POOL", "TEXT_CACHE", "DirtyRects",
+           "TextureAtlas", "extract_image_from_spritesheet")
 
 
 def fetch(filename: str) -> dict:
@@ -47,6 +62,73 @@ def save(filename: str = None, data: dict = None, mode: str = 'w') -> None:
         json.dump(data, f, indent=4)
 
 
+# bundle of the assert, if None the assert are loaded from the files.
+_bundle = None
+
+
+def use_bundle(filename: str = None) -> AssetBundle:
+    '''
+    :function: used to load the assert from the bundle built by the `component.bundle`,
+    files not packed in the bundle are still loaded from the disk.
+
+    :param filename: filename of the bundle, if None the bundle in use is closed and the
+    assert are loaded from the files.
+
+    :return: the bundle in use.
+    '''
+    global _bundle
+
+    if _bundle is not None:
+        _bundle.close()
+        _bundle = None
+    if filename:
+        _bundle = AssetBundle(filename)
+
+    return _bundle
+
+
+def asset_file(filename: str) -> object:
+    '''
+    :function: used to get the file of an assert, the pygame loaders accept both.
+
+    :return: file object from the bundle if the file is packed, otherwise the filename.
+    '''
+    if _bundle is not None and filename and filename in _bundle:
+        return _bundle.open(filename)
+    return filename
+
+
+def read_asset(filename: str) -> bytes:
+    ''':function: used to read the content of an assert, from the bundle if packed.'''
+    if _bundle is not None and filename in _bundle:
+        return _bundle.read(filename)
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+def load_sound(filename: str) -> pygame.mixer.Sound:
+    ''':function: used to load sound from file, from the bundle if packed.'''
+    return pygame.mixer.Sound(asset_file(filename))
+
+
+# images loaded in advance, keyed by the arguments of the load_image.
+_preloaded_images = {}
+
+
+def _image_key(filename: str, scale: tuple[int, int], convert: tuple[bool, bool]) -> tuple:
+    ''':function: internal function, key of an image in the preloaded images.'''
+    return (filename, tuple(scale) if scale else None, tuple(convert))
+
+
+def preload_image(image: pygame.Surface, filename: str, scale: tuple[int, int] = None,
+                  convert: tuple[bool, bool] = (False, False)) -> None:
+    '''
+    :function: used to register an image already loaded (i.e by the AssetManager), the
+    load_image called with the same arguments returns it instead of reading the file.
+    '''
+    _preloaded_images[_image_key(filename, scale, convert)] = image
+
+
 def load_image(filename: str, scale: tuple[int, int] = None,
                convert: tuple[bool, bool] = (False, False)) -> pygame.Surface:
     '''
@@ -61,7 +143,12 @@ def load_image(filename: str, scale: tuple[int, int] = None,
     :return: pygame surface of image.
     '''
 
-    image = pygame.image.load(filename)
+    # image already loaded, see the preload_image.
+    image = _preloaded_images.get(_image_key(filename, scale, convert))
+    if image is not None:
+        return image
+
+    image = pygame.image.load(asset_file(filename), filename)
 
     if scale:  # scale the image if needed
         image = pygame.transform.scale(image, scale)
@@ -75,31 +162,220 @@ def load_image(filename: str, scale: tuple[int, int] = None,
     return image
 
 
-# method is not used in this version.
-# def extract_image_from_spritesheet(spritesheetname: str, split: tuple[int, int]) -> list:
-#     ''''''
-#     image = pygame.image.load(spritesheetname)
-#     size = image.get_size()
-#     x_size = size[0] // split[0]  # no. of slice in x direction
-#     y_size = size[1] // split[1]  # no. of slice in y direction.
-#     images = []  # hold the new slice images.
+def extract_image_from_spritesheet(spritesheet: object, split: tuple[int, int]) -> list:
+    '''
+    :function: used to slice a sprite-sheet into equal size images.
+
+    :param spritesheet: pygame surface or filename of the sprite-sheet.
+    :param split: (no. of slice in x direction, no. of slice in y direction).
+
+    :return: subsurfaces of the sheet, in a order of left -> right and top -> bottom
+    from the topleft corner of the sheet.
+    '''
+    if not isinstance(spritesheet, pygame.Surface):
+        spritesheet = load_image(spritesheet)
+
+    width, height = spritesheet.get_size()
+    x_size = width // split[0]  # width of a slice
+    y_size = height // split[1]  # height of a slice.
+
+    return [spritesheet.subsurface((x, y, x_size, y_size))
+            for y in range(0, y_size * split[1], y_size)
+            for x in range(0, x_size * split[0], x_size)]
+
+
+class TextureAtlas:
+    '''
+    :class: packs many images into a single surface, each image becomes a named region
+    (rect) of the sheet and can be used as a subsurface or as the area of a blit.
+
+    i.e
+    atlas = TextureAtlas({"gameover": gameover_img, "0": zero_img}, convert=(False, True))
+    atlas.blit(screen, "gameover", (175, 198))
+    zero = atlas.image("0")  # subsurface, shares the pixels of the sheet
+    '''
+    all = ("image", "images", "blit", "manifest")
+
+    def __init__(self, images: dict, convert: tuple[bool, bool] = (False, False),
+                 max_width: int = 1024, padding: int = 1):
+        '''
+        :param images: name -> pygame surface of the images to pack.
+        :param convert: same as the load_image, applied to the sheet.
+        :param max_width: width limit of the sheet.
+        :param padding: space in between the regions, avoid bleeding of the pixels.
+        '''
+        self.regions = self._pack({name: image.get_size() for name, image in images.items()},
+                                  max_width, padding)
+
+        width = max((rect.right for rect in self.regions.values()), default=0)
+        height = max((rect.bottom for rect in self.regions.values()), default=0)
+        self.sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.sheet.blits([(images[name], rect) for name, rect in self.regions.items()],
+                         doreturn=False)
+
+        # apply conversion.
+        if convert[0]:
+            self.sheet = self.sheet.convert()
+        elif convert[1]:
+            self.sheet = self.sheet.convert_alpha()
+
+        self._subsurfaces = {}
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.regions)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    @staticmethod
+    def _pack(sizes: dict, max_width: int, padding: int) -> dict:
+        ''':method: internal method, shelf packing, tallest images first.'''
+        regions = {}
+        x = y = shelf_height = 0
+        for name in sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0])):
+            width, height = sizes[name]
+            if x and x + width > max_width:  # start a new shelf.
+                x, y = 0, y + shelf_height + padding
+                shelf_height = 0
+            regions[name] = pygame.Rect(x, y, width, height)
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+
+        return regions
+
+    def image(self, name: str) -> pygame.Surface:
+        ''':method: subsurface of the region, created once.'''
+        image = self._subsurfaces.get(name)
+        if image is None:
+            image = self._subsurfaces[name] = self.sheet.subsurface(self.regions[name])
+        return image
+
+    def images(self, names: list) -> list:
+        ''':method: subsurfaces of the regions.'''
+        return [self.image(name) for name in names]
+
+    def blit(self, screen: pygame.Surface, name: str, pos: tuple[int, int]) -> pygame.Rect:
+        ''':method: draw the region on the screen, the sheet is blit with the region as area.'''
+        return screen.blit(self.sheet, pos, self.regions[name])
+
+    def manifest(self) -> dict:
+        ''':method: used to get the regions, name -> [x, y, width, height].'''
+        return {name: list(rect) for name, rect in self.regions.items()}
+
+
+class FontPool:
+    ''':class: process wide pool of pygame fonts, each font file/system font is opened once
+        per (name, size, bold, italic, underline).
+
+        Note: fonts of the pool are shared, don't change the style of a font got from it.
+    '''
+    all = ("get", "clear")
+
+    def __init__(self):
+        self.fonts = {}
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.fonts)
+
+    def get(self, name: str, size: int, bold: bool = False, italic: bool = False,
+            underline: bool = False, sysfont: bool = False) -> pygame.font.Font:
+        ''':method: used to get the font, the font is created on the first request.
 
-#     # slice in a order of left -> right of the image and
-#     # top -> bottom from the topleft corner of the image
-#     for y in range(0, size[0], y_size):
-#         for x in range(0, size[1], x_size):
-#             images.append(clip(image, x, y, size[0] // split[0], size[1] // split[1]))
+            :param name: filename of the font, or name of the system font if sysfont is True.
+        '''
+        key = (name, size, bold, italic, underline, sysfont)
+        font = self.fonts.get(key)
+
+        if font is None:
+            if sysfont:
+                font = pygame.font.SysFont(name, size)
+            else:
+                font = pygame.font.Font(asset_file(name), size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            font.set_underline(underline)
+            self.fonts[key] = font
+
+        return font
+
+    def clear(self) -> None:
+        ''':method: remove all the fonts from the pool.'''
+        self.fonts.clear()
+
+
+class TextCache:
+    ''':class: least recently used cache of the rendered text surfaces, keyed by
+        (text, font, color, antialias, background).
+
+        Note: surfaces of the cache are shared, copy them before changing them.
+    '''
+    all = ("render", "clear", "info")
+
+    def __init__(self, maxsize: int = 256):
+        ''':param maxsize: maximum number of surfaces, the least recently used one is
+            evicted once the cache is full.
+        '''
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def __len__(self):
+        return len(self.surfaces)
 
-#     return images
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: object,
+               background: object = None) -> pygame.Surface:
+        ''':method: same as `font.render` but the surface is rendered once.'''
+        # colors passed as list are not hashable.
+        if isinstance(color, list):
+            color = tuple(color)
+        if isinstance(background, list):
+            background = tuple(background)
 
+        key = (text, font, color, antialias, background)
+        surface = self.surfaces.get(key)
 
-# def clip(surface: pygame.Surface, x: int, y: int,
-#          x_size: int, y_size: int) -> pygame.Surface:
-#     handle_surface = surface.copy()  # Sprite that will get process later
-#     clipRect = pygame.Rect(x, y, x_size, y_size)  # Part of the image
-#     handle_surface.set_clip(clipRect)  # Clip or you can call cropped
-#     image = surface.subsurface(handle_surface.get_clip())  # Get subsurface
-#     return image.copy()
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def clear(self) -> None:
+        ''':method: remove all the surfaces and reset the counters.'''
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> dict:
+        ''':method: used to get the statistics of the cache.'''
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.surfaces), "maxsize": self.maxsize}
+
+
+# shared by all the widgets of the game.
+FONT_POOL = FontPool()
+TEXT_CACHE = TextCache()
 
 
 class Text:
@@ -132,14 +408,14 @@ class Text:
 
     def setup(self):
         ''':method: used to set up the font in the pygame'''
-        self.font = pygame.font.Font(self.fontname, self.fontsize)
-        self.font.set_bold(self.bold)
-        self.font.set_italic(self.italic)
-        self.font.set_underline(self.underline)
+        self.font = FONT_POOL.get(self.fontname, self.fontsize, self.bold, self.italic,
+                                  self.underline)
 
     def render(self):
         ''':method: used to render font'''
-        self.img = self.font.render(self.text, self.antialias, self.fontcolor, self.background)
+        # the rendered surface is shared through the cache.
+        self.img = TEXT_CACHE.render(self.font, self.text, self.antialias, self.fontcolor,
+                                     self.background)
 
         '''
         this section of script only executed when size parameter is passed, by using that
@@ -168,8 +444,13 @@ class Text:
             text_box.fill(self.background)
             text_box.blit(self.img, (x, y))
             self.img = text_box
+            self.img.set_alpha(self.alpha)
+
+        elif self.alpha != 255:
+            # cached surface must not be changed, so the alpha is applied on a copy.
+            self.img = self.img.copy()
+            self.img.set_alpha(self.alpha)
 
-        self.img.set_alpha(self.alpha)
         self.rect = self.img.get_rect(topleft=self.pos)
 
     def blit(self, screen: pygame.Surface):
@@ -189,10 +470,8 @@ class SysFont(Text):
 
     def setup(self):
         ''':method: used to set up a system font in the pygame'''
-        self.font = pygame.font.SysFont(self.fontname, self.fontsize)
-        self.font.set_bold(self.bold)
-        self.font.set_italic(self.italic)
-        self.font.set_underline(self.underline)
+        self.font = FONT_POOL.get(self.fontname, self.fontsize, self.bold, self.italic,
+                                  self.underline, sysfont=True)
 
 
 class Label(SysFont, Text):
@@ -242,15 +521,15 @@ class Button(Label):
     '''
 
     def __init__(self, text: str, pos: tuple[int, int], command: object = None, **kw):
+        # default alpha of the button, applied by :class Text: while rendering.
+        kw["alpha"] = kw.get("alpha") or 225
         super().__init__(text, pos, **kw)
 
         self.command = command
         self.focuscolor = kw.get("focuscolor") or "#57F0DB"
-        self.alpha = kw.get("alpha") or 225
         self.active = kw.get("active") or False
         self.focused = kw.get("focused") or False
         self.activecolor = kw.get("activecolor") or "#48FA7B"
-        self.img.set_alpha(self.alpha)
 
         self.focus_surf = pygame.Surface(self.rect.size)
         self.focus_surf.fill(self.focuscolor)
@@ -261,9 +540,28 @@ class Button(Label):
         self.active_surf.set_alpha(200 * (self.alpha / 225))
 
         self.disable = False
+        # focus and press of the button, set by the input dispatcher (see :method set_input:).
+        self.pressed = False
+
+        # look of the button the last time it was drawn, see :method changed:.
+        self._drawn_state = None
 
         # adding more function to the base class list
-        self.all = (self.all, "on_press", "on_focus", "on_active")
+        self.all = (self.all, "on_press", "on_focus", "on_active", "set_input", "changed")
+
+    def set_input(self, focused: bool, pressed: bool) -> None:
+        ''':method: used to set the mouse focus and the press of the button, called once per
+            frame by the `InputDispatcher` before the button is drawn.
+
+            Note: pressed is True only in the frame of the click, holding does not repeat it.
+        '''
+        self.focused = focused
+        self.pressed = pressed and not self.disable
+
+    @property
+    def changed(self) -> bool:
+        ''':method: True if the button would look different than the last time it was drawn.'''
+        return (self.focused, self.active, self.rect.topleft) != self._drawn_state
 
     def on_press(self):
         ''':method: fired when the button clicked'''
@@ -286,20 +584,12 @@ class Button(Label):
            Note: used this function to get full control over the button functionality.
         '''
         self.screen = screen
-        mouse_pos = pygame.mouse.get_pos()
 
         # default button
         self.screen.blit(self.img, self.rect)
 
-        # if collide
-        self.pressed = False
-        self.focused = False
-        if self.rect.collidepoint(mouse_pos):
-            self.focused = True
-
-            key = pygame.key.get_pressed()
-            if (key[pygame.K_RETURN] or pygame.mouse.get_pressed(3)[0]) and not self.disable:
-                self.pressed = True
+        # track the visual state, the scene draws the button again only once it changed.
+        self._drawn_state = (self.focused, self.active, self.rect.topleft)
 
         self.on_focus()
         self.on_active()
@@ -320,7 +610,7 @@ class BoxLayout:
     boxlayout.blit(pygame.Surface)
     '''
 
-    all = ("add", "blit")
+    all = ("add", "layout", "blit")
 
     def __init__(self, size: tuple[int, int], **kw):
         self.orientation = kw.get("orientation") or "horizontal"
@@ -336,12 +626,8 @@ class BoxLayout:
             self._size[0] += child.rect.width
             self._size[1] += child.rect.height
 
-    def blit(self, screen: pygame.Surface) -> None:
-        ''':method: used to update and draw widget on the screen
-
-            Note: used this function rather than regular blit function.
-        '''
-
+    def layout(self) -> None:
+        ''':method: place the children without drawing them.'''
         if self.orientation == "horizontal":
             x = (self.size[0] - self._size[0]) // 2
 
@@ -351,8 +637,6 @@ class BoxLayout:
                 else:
                     child.rect.x = self.chlidren[index - 1].rect.right + self.spacing
 
-                child.blit(screen)
-
         if self.orientation == "vertical":
             y = (self.size[1] - self._size[1]) // 2
 
@@ -361,7 +645,15 @@ class BoxLayout:
                     child.rect.y = y
                 else:
                     child.rect.y = self.chlidren[index - 1].rect.bottom + self.spacing
-                child.blit(screen)
+
+    def blit(self, screen: pygame.Surface) -> None:
+        ''':method: used to update and draw widget on the screen
+
+            Note: used this function rather than regular blit function.
+        '''
+        self.layout()
+        for child in self.chlidren:
+            child.blit(screen)
 
 
 class TextBox:
@@ -416,3 +708,47 @@ class TextBox:
         screen.fill(self.textbackground)
         for item in self.textgroup:
             item.blit(screen)
+
+
+class DirtyRects:
+    '''
+    :class: collects the regions of the screen changed in a frame and pushes only those
+    regions to the display, instead of the whole screen.
+
+    Note: call :method invalidate: whenever the whole screen changes (i.e state changed or
+    scrolling layers are moving), the next :method update: is a full flip.
+
+    i.e
+    display = DirtyRects()
+    display.add(button.rect)
+    display.update()  # at the end of the frame
+    '''
+    all = ("add", "invalidate", "update")
+
+    def __init__(self, enabled: bool = True):
+        ''':param enabled: if False every update is a full flip.'''
+        self.enabled = enabled
+        self.rects = []
+        self.full = True
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def add(self, *rects: pygame.Rect) -> None:
+        ''':method: mark the regions as changed in this frame.'''
+        if self.enabled and not self.full:
+            self.rects.extend(pygame.Rect(rect) for rect in rects)
+
+    def invalidate(self) -> None:
+        ''':method: mark the whole screen as changed in this frame.'''
+        self.full = True
+
+    def update(self) -> None:
+        ''':method: push the changed regions to the display and start a new frame.'''
+        if not self.enabled or self.full:
+            pygame.display.update()
+        elif self.rects:
+            pygame.display.update(self.rects)
+
+        self.rects.clear()
+        self.full = False
@@ -0,0 +1,179 @@
+'''
+:about: watchdog of the frame budget, every frame is profiled with `cProfile` and the
+    profile of a frame over the budget, along with the next few frames, is saved into a
+    rotating directory.
+:class FrameWatchdog: profiles the frames and saves the captures of the slow ones.
+
+each capture is saved as two files named `<time>-<state>-<score>-<ms>ms`:
+    .prof: `pstats` file, i.e `python -m pstats <file>.prof` or snakeviz.
+    .txt: frame times, garbage collection pauses and the top functions by cumulative time.
+
+i.e
+watchdog = FrameWatchdog(budget=50)
+watchdog.begin_frame()
+...  # the frame
+watchdog.pause()
+clock.tick(30)  # the wait of the frame pacing is not part of the budget.
+watchdog.resume()
+watchdog.end_frame(state, score)
+
+Note: the profiling slows the frames down, so the watchdog is only created when a budget
+is set, the game loop does not call anything when it is disabled.
+'''
+import io
+import os
+import gc
+import time
+import pstats
+import cProfile
+
+all = ("FrameWatchdog")
+
+# Constants
+SUMMARY_LINES = 30
+
+
+class FrameWatchdog:
+    '''
+    :class: profiles each frame, when a frame takes more than the budget it is saved with
+    the next `frames` frames as a single capture.
+    '''
+    all = ("begin_frame", "pause", "resume", "end_frame", "captures", "close")
+
+    def __init__(self, budget: float, frames: int = 5, directory: str = "profiles",
+                 keep: int = 20):
+        '''
+        :param budget: budget of a frame in milli-seconds.
+        :param frames: number of frames profiled after the slow one.
+        :param directory: directory of the captures.
+        :param keep: number of captures kept, the oldest ones are removed.
+        '''
+        self.budget = budget
+        self.frames = frames
+        self.directory = directory
+        self.keep = keep
+
+        self._profile = None
+        self._start = 0.0
+        # time the profiling was paused in the current frame.
+        self._paused = 0.0
+        self._pause_start = 0.0
+        # time spent in the garbage collection in the current frame.
+        self._gc_time = 0.0
+        self._gc_start = 0.0
+
+        # capture in progress.
+        self._stats = None
+        self._remaining = 0
+        self._tag = None
+        self._lines = []
+
+        self.saved = 0
+        gc.callbacks.append(self._on_gc)
+
+    def __str__(self):
+        return f"{self.__class__}: {self.all}"
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        ''':method: internal method, times the garbage collection pauses.'''
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self._gc_time += time.perf_counter() - self._gc_start
+
+    def begin_frame(self) -> None:
+        ''':method: start profiling a frame.'''
+        self._gc_time = 0.0
+        self._paused = 0.0
+        self._profile = cProfile.Profile()
+        self._start = time.perf_counter()
+        self._profile.enable()
+
+    def pause(self) -> None:
+        ''':method: stop profiling until :method resume:, i.e while the frame waits for
+            the clock, the pause is not counted in the time of the frame.
+        '''
+        self._profile.disable()
+        self._pause_start = time.perf_counter()
+
+    def resume(self) -> None:
+        ''':method: profile the frame again after :method pause:.'''
+        self._paused += time.perf_counter() - self._pause_start
+        self._profile.enable()
+
+    def end_frame(self, state: str, score: int) -> None:
+        ''':method: stop profiling the frame, a capture is started if the frame is over
+            the budget.
+
+            :param state: state of the game, used to tag the capture.
+            :param score: score of the game, used to tag the capture.
+        '''
+        self._profile.disable()
+        elapsed = (time.perf_counter() - self._start - self._paused) * 1000
+        profile, self._profile = self._profile, None
+
+        if self._stats is None and elapsed <= self.budget:
+            return
+
+        line = f"{elapsed:8.2f} ms  gc {self._gc_time * 1000:6.2f} ms  {state} score {score}"
+        if self._stats is None:
+            # this frame is over the budget, the capture starts from it.
+            self._stats = pstats.Stats(profile)
+            self._remaining = self.frames
+            self._tag = (state, score, elapsed)
+            self._lines = [line + "  <- over budget"]
+            return
+
+        self._stats.add(profile)
+        self._lines.append(line)
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._save()
+
+    def _save(self) -> None:
+        ''':method: internal method, write the capture and remove the oldest ones.'''
+        os.makedirs(self.directory, exist_ok=True)
+        state, score, elapsed = self._tag
+        state = "".join(char if char.isalnum() else "_" for char in state)
+        name = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.saved}-"
+                                            f"{state}-{score}-{elapsed:.0f}ms")
+
+        self._stats.dump_stats(name + ".prof")
+
+        report = io.StringIO()
+        report.write(f"budget {self.budget:.2f} ms\n")
+        report.write("\n".join(self._lines) + "\n\n")
+        self._stats.stream = report
+        self._stats.sort_stats("cumulative").print_stats(SUMMARY_LINES)
+        with open(name + ".txt", "w") as f:
+            f.write(report.getvalue())
+
+        self.saved += 1
+        self._stats = None
+        self._lines = []
+        self._rotate()
+
+    def _rotate(self) -> None:
+        ''':method: internal method, keep only the newest captures.'''
+        captures = self.captures()
+        for name in captures[:max(0, len(captures) - self.keep)]:
+            for extension in (".prof", ".txt"):
+                filename = os.path.join(self.directory, name + extension)
+                if os.path.isfile(filename):
+                    os.remove(filename)
+
+    def captures(self) -> list:
+        ''':method: names of the captures saved in the directory, oldest first.'''
+        if not os.path.isdir(self.directory):
+            return []
+        names = [filename[:-len(".prof")] for filename in os.listdir(self.directory)
+                 if filename.endswith(".prof")]
+        return sorted(names, key=lambda name: os.path.getmtime(
+            os.path.join(self.directory, name + ".prof")))
+
+    def close(self) -> None:
+        ''':method: stop the watchdog, a capture in progress is saved.'''
+        if self._stats is not None:
+            self._save()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
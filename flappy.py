@@ -17,37 +17,284 @@ This script file controls, all the game related stuff i.e game state, rendering
 import pygame
 from pygame.locals import *
 import os
+import sys
+import time
+import random
+import argparse
 
 # import in-built module/component
 from component.utils import *
-from component.flappy import Flappy
-from component.pipes import ObsticalControler, MovingImage
+from component.simulation import Simulation, SimulationRenderer, SimInput, FixedTimestep
 from component.ui import GameUI
+from component.replay import Replay, ReplayRecorder, ReplayPlayer
+from component.assets import AssetManager
+from component.profiler import FrameProfiler
+from component.watchdog import FrameWatchdog
+from component.input import InputDispatcher, ACTION_QUIT, ACTION_PROFILER
+from component.scene import Scene, SceneStack
+from component.pacing import FramePacer
 
-all = ("Game", "main")
+all = ("Game", "MenuScene", "SettingsScene", "AboutScene", "PlayScene", "main")
 
 # absolute path of the current files
 ASSERT_PATH = "assert"
 DATA_FILENAME = "data.json"
+REPLAY_PATH = "replays"
+BUNDLE_PATH = "assert.bundle"
+PROFILE_PATH = "profiles"
 
 # Constants
 SCREEN_SIZE = (640, 480)
 TITLE = "Flappy Game"
 
 
+class MenuScene(Scene):
+    ''':class: main menu of the game, new game, continue, settings and about.'''
+    name = "Menu"
+
+    def __init__(self, game: "Game"):
+        super().__init__(game)
+        self.menu = game.gameui.gamemenu_boxlayout
+        self.buttons = (*self.menu.chlidren, game.gameui.about_btn)
+        # the buttons are placed once, they are drawn by :method Scene.draw:.
+        self.menu.layout()
+
+    def render_static(self, surface: pygame.Surface) -> None:
+        surface.fill("#383838")
+
+    def update(self, delta_time: float, kw: dict) -> None:
+        game = self.game
+        new_game_btn, con_game_btn, set_game_btn = self.menu.chlidren
+
+        '''
+        if continuation of the game is possible than the continue button gets
+        highlighted.
+        '''
+        con_game_btn.active = game._gamedata["continue"]
+        self.draw(game.screen, game.display)
+
+        # trigger the functions according to the button pressed.
+        # `New Game` button pressed.
+        if new_game_btn.pressed:
+            game.new_game()
+            game.change_scene("Start New Game")
+            '''
+            only the the assert would draw and nothing gets updated.
+            '''
+            game._allow_update = False
+
+        # `Continue` button pressed and continuation is possible.
+        elif con_game_btn.pressed and game._gamedata["continue"]:
+            game.continue_game()
+            # start the game as previous
+            game.change_scene("Start New Game")
+            game._allow_update = False
+
+        # `Setting` button is pressed.
+        elif set_game_btn.pressed:
+            game.change_scene("Settings")
+
+        # `About` button is pressed
+        elif game.gameui.about_btn.pressed:
+            game.change_scene("About")
+
+
+class SettingsScene(Scene):
+    ''':class: settings of the game, pushed over the menu.'''
+    name = "Settings"
+    stacked = True
+
+    def __init__(self, game: "Game"):
+        super().__init__(game)
+        self.menus = (game.gameui.settingmenu_boxlayout_1, game.gameui.settingmenu_boxlayout_2)
+        self.buttons = tuple(child for menu in self.menus for child in menu.chlidren
+                             if isinstance(child, Button))
+        for menu in self.menus:
+            menu.layout()
+
+    def render_static(self, surface: pygame.Surface) -> None:
+        surface.fill("#383838")
+        # labels of the settings are static, the buttons are drawn by :method Scene.draw:.
+        for menu in self.menus:
+            for child in menu.chlidren:
+                if child not in self.buttons:
+                    child.blit(surface)
+
+    def update(self, delta_time: float, kw: dict) -> None:
+        game = self.game
+        gameui = game.gameui
+
+        # trigger functions when the button inside the setting menu get pressed.
+        for button, fps in gameui.fps_buttons:
+            if button.pressed:
+                # updates the entire game fps
+                game._gamedata["fps"] = fps
+        for button, precise in gameui.pacing_buttons:
+            if button.pressed:
+                game._gamedata["precise_pacing"] = precise
+
+        # the buttons of the settings used by the game are active.
+        for button, fps in gameui.fps_buttons:
+            button.active = fps == game._gamedata["fps"]
+        for button, precise in gameui.pacing_buttons:
+            button.active = precise == game._gamedata.get("precise_pacing", False)
+
+        self.draw(game.screen, game.display)
+
+        if kw["K_x"]:
+            game.change_scene("Menu")
+
+
+class AboutScene(Scene):
+    ''':class: details of the game, pushed over the menu.'''
+    name = "About"
+    stacked = True
+
+    def render_static(self, surface: pygame.Surface) -> None:
+        # textbox content all the details for the game gets visible.
+        self.game.textbox.blit(surface)
+
+    def update(self, delta_time: float, kw: dict) -> None:
+        self.draw(self.game.screen, self.game.display)
+
+        if kw["K_x"]:
+            self.game.change_scene("Menu")
+
+
+class PlayScene(Scene):
+    ''':class: the game itself, the whole screen is drawn again every frame.'''
+    name = "Start New Game"
+
+    @property
+    def idle(self) -> bool:
+        '''the game is paused, waiting for the start or over.'''
+        return not self.game._allow_update or self.game._gameover
+
+    def update(self, delta_time: float, kw: dict) -> None:
+        game = self.game
+
+        # called when the game is not over and ready to play.
+        if not game._gameover:
+            # if allow update is True
+            if game._allow_update:
+                '''
+                update all the entities by fixed steps, the flap is applied by the
+                first step run after it get pressed.
+                '''
+                game._pending_flap = game._pending_flap or kw["K_SPACE"]
+
+                for _ in range(game.timestep.advance(delta_time)):
+                    game._sim_input.flap = game._pending_flap
+                    game._pending_flap = False
+                    game.recorder.record(game._sim_input)
+                    events = game.simulation.step(game.timestep.step, game._sim_input)
+
+                    '''
+                    play the sound when the entity flap it's wings.
+                    '''
+                    if events.flapped:
+                        game.wing.play()
+
+                    '''
+                    play sound when the point get incresed
+                    '''
+                    if events.scored:
+                        game.point.play()
+
+                    # check collision of the entity with the pipes and the base
+                    if events.hit:
+                        game.hit.play()
+                        game._allow_update = False
+                        game._gameover = True
+                        game.save_replay()
+                        break
+
+                game.profiler.mark("update")
+                game.renderer.draw(game.simulation, game.timestep.alpha)
+            else:
+                # message show when update is False
+                '''
+                This message is show during the game start, continuation of the game,
+                and also during the game get paused.
+                '''
+                game.renderer.draw(game.simulation)
+                game.gameui.start_message(game.screen)
+            # the whole screen got drawn.
+            self._redraw = False
+
+            '''
+            below code handles the functionality of the pause mechanism by
+            manipulating :attr game._allow_update:
+            '''
+            if kw["K_p"] and game._allow_update:
+                game._allow_update = False
+            elif kw["K_p"] and not game._allow_update:
+                game._allow_update = True
+            elif kw["K_SPACE"] and not game._allow_update:
+                game._allow_update = True
+
+            '''
+            during the game is running, and the back button is pressed then the
+            continuation data gets save, and continuation gets updated.
+            '''
+            if kw["K_x"]:
+                game.save_continuation()
+
+                # back to the main menu
+                game.change_scene("Menu")
+                game.new_game()
+
+        # called when the game gets over.
+        elif game._gameover:
+            '''
+            the screen is not drawn again while the game is over, only once something got
+            drawn over it, i.e the frame-time overlay got hidden. The alpha of the last
+            frame is kept, so it is drawn the same.
+            '''
+            if self._redraw:
+                self._redraw = False
+                game.renderer.draw(game.simulation, game.timestep.alpha)
+
+            # store high-score data if score is greater.
+            if game.obstical.score > game._gamedata["highscore"]:
+                game._gamedata["highscore"] = game.obstical.score
+
+            # if high-score is greater than '0' it gets displayed on screen.
+            if game._gamedata["highscore"]:
+                game.gameui.show_highscore(game.screen, game._gamedata["highscore"])
+
+            # finally game-over message would be shown.
+            game.gameui.gameover_message(game.screen)
+
+            if kw["K_x"]:
+                # back to the main menu
+                game.change_scene("Menu")
+                # reset the game over button
+                game.new_game()
+                game._gamedata["continue"] = False
+
+        if kw["K_r"] and game._gameover:
+            # resume the game and its state
+            game.new_game()
+
+
 class Game:
     ''':class: control the whole game, handles game state, handles rendering,
         handles inputs, handles I/O in file.
     '''
     FPS = None  # keep information of the the frame-per-second of the game
-    all = ("setup", "update", "new_game", "run")
+    all = ("setup", "change_scene", "update", "continue_game", "save_continuation",
+           "new_game", "run")
 
-    def __init__(self, window_size: tuple[int, int], window_title: str):
+    def __init__(self, window_size: tuple[int, int], window_title: str, seed: int = None):
+        '''
+        :param seed: seed of the game, each new game gets its own seed drawn from it.
+        '''
         self.screen = pygame.display.set_mode(window_size)
         pygame.display.set_caption(window_title)
 
-        # clock for the game controls the game time.
-        self.clock = pygame.time.Clock()
+        # paces the frames of the game loop and controls the game time.
+        self.pacer = FramePacer()
 
         # store all the game data need for processing game
         self._gamedata = dict()
@@ -57,8 +304,31 @@ class Game:
         # decide whether the game-over or not
         self._gameover = False
 
-        # store the game state
-        self._game_state = "Menu"
+        # scenes of the game, the top one is the game state.
+        self.scenes = SceneStack()
+        # name -> scene, created by :method setup:.
+        self._scenes = {}
+
+        # random generator owned by the game, used to seed each new game.
+        self.rng = random.Random(seed)
+        # records the inputs of the games, so they can be replayed.
+        self.recorder = ReplayRecorder()
+
+        # pushes the frame to the display, only the changed regions if enabled.
+        self.display = DirtyRects(enabled=False)
+        # scene of the game drawn in the last frame.
+        self._drawn_scene = None
+
+        # input of the game, polled once per frame.
+        self.input = InputDispatcher()
+        # shortcut keys responsible for controlling inputs in the whole game, the dict is
+        # updated in place by the input dispatcher.
+        self.ShortCuts = self.input.shortcuts
+
+        # frame-time profiler, its overlay is toggled with F3.
+        self.profiler = FrameProfiler()
+        # profiles the frames over the budget, None when disabled.
+        self.watchdog = None
 
     def setup(self) -> None:
         ''':method: used to load all the assert for the game'''
@@ -66,324 +336,293 @@ class Game:
         # fetching all the data from the file.
         self._gamedata = fetch(os.path.join(ASSERT_PATH, DATA_FILENAME))
 
-        # fetching all content for the about file.
-        with open(os.path.join(ASSERT_PATH, "about.txt"), "r") as f:
-            about_data = f.read()
-
-        # load entity for the game.
-        flappy_images = []
+        # dirty rectangle rendering is opt-in.
+        self.display.enabled = self._gamedata.get("dirty_rects", False)
 
-        for i in range(3):
-            flappy_images.append(load_image(self._gamedata["yellowbird"][i], convert=(False, True)))
+        # watchdog of the frame budget is opt-in, it profiles every frame.
+        if self._gamedata.get("watchdog_budget_ms") and self.watchdog is None:
+            self.watchdog = FrameWatchdog(self._gamedata["watchdog_budget_ms"],
+                                          directory=PROFILE_PATH)
 
-        # position of the player is in middle of the screen.
-        self.flappy = Flappy(flappy_images=flappy_images, weight=self._gamedata["entity"]["weight"],
-                             fly_speed=self._gamedata["entity"]["fly_speed"],
-                             pos=(320, 184))
+        '''
+        all the assert are decoded in parallel while the loading screen is shown, the
+        images are then picked up by the `load_image` of each component.
+        '''
+        self.assets = AssetManager()
+        self._queue_assets(self.assets)
+        self.assets.load(progress=self._show_loading)
+        if self._gamedata.get("show_load_timings", False):
+            print(self.assets.report())
 
-        # load all the obstical for the game.
-        green_pipe = load_image(self._gamedata["game_objects"]["pipe-green"], convert=(True, False))
-        self.obstical = ObsticalControler(green_pipe)
+        # fetching all content for the about file.
+        about_data = self.assets.texts["about"]
+
+        # load all the entity, obstical and environment for the game.
+        self.simulation = Simulation.from_data(self._gamedata)
+        self.flappy = self.simulation.flappy
+        self.obstical = self.simulation.obstical
+        self.background_day_image = self.simulation.background
+        self.base_image = self.simulation.base
+        # reused in between the frames as the input of the simulation.
+        self._sim_input = SimInput()
+        # flap pressed but not yet consumed by a simulation step.
+        self._pending_flap = False
 
-        # load all the environment for the game.
-        self.background_day_image = MovingImage(load_image(
-                                                self._gamedata["game_objects"]["background-day"],
-                                                SCREEN_SIZE, (True, False)), (0, 0))
-        self.base_image = MovingImage(load_image(self._gamedata["game_objects"]["base"], (640, 112),
-                                                 convert=(True, False)), (0, 368))
+        '''
+        the simulation runs at a fixed rate decoupled from the fps, the renderer
+        interpolates in between the last two steps.
+        '''
+        self.timestep = FixedTimestep(self._gamedata.get("sim_rate", 120))
+        self.simulation.track_previous = True
 
         # load all sounds for the game.
-        self.hit = pygame.mixer.Sound(self._gamedata["sfx"]["hit"])
-        self.wing = pygame.mixer.Sound(self._gamedata["sfx"]["wing"])
-        self.point = pygame.mixer.Sound(self._gamedata["sfx"]["point"])
-        self.die = pygame.mixer.Sound(self._gamedata["sfx"]["die"])
+        self.hit = self.assets.sounds["hit"]
+        self.wing = self.assets.sounds["wing"]
+        self.point = self.assets.sounds["point"]
+        self.die = self.assets.sounds["die"]
 
         # load all the UI for the game.
         self.gameui = GameUI(self._gamedata)
+        # renderer draws the simulation once per frame.
+        self.renderer = SimulationRenderer(self.screen, self.gameui)
         # text box for the game.
         self.textbox = TextBox(about_data, (0, 0), fontname=self._gamedata["font"]["gamefont"],
                                fontcolor="#F5EBEB", fontsize=22)
 
+        # scenes of the game, the game starts again from the current scene.
+        current = self.scenes.top.name if self.scenes.top else "Menu"
+        self._scenes = {scene.name: scene for scene in (
+            MenuScene(self), SettingsScene(self), AboutScene(self), PlayScene(self))}
+        self.scenes.reset(self._scenes[current])
+
+    def _queue_assets(self, assets: AssetManager) -> None:
+        ''':method: internal method, queue all the assert of the game.
+
+            Note: images are queued with the same arguments as they are loaded with by the
+            :class Simulation: and the :class GameUI:.
+        '''
+        for filename in self._gamedata["yellowbird"]:
+            assets.image(filename, convert=(False, True))
+
+        game_objects = self._gamedata["game_objects"]
+        assets.image(game_objects["pipe-green"], convert=(True, False))
+        assets.image(game_objects["background-day"], SCREEN_SIZE, (True, False))
+        assets.image(game_objects["base"], (640, 112), convert=(True, False))
+
+        ui = self._gamedata["ui"]
+        assets.image(ui["message"], (284, 480), convert=(False, True))
+        assets.image(ui["gameover"], (292, 42), convert=(False, True))
+        for filename in ui["numbers"]:
+            assets.image(filename, convert=(False, True))
+
+        for name, filename in self._gamedata["sfx"].items():
+            assets.sound(name, filename)
+        assets.text("about", os.path.join(ASSERT_PATH, "about.txt"))
+
+    def _show_loading(self, done: int, total: int, name: str) -> None:
+        ''':method: internal method, draw the loading screen with the progress.'''
+        pygame.event.pump()  # keep the window responsive.
+
+        self.screen.fill("#383838")
+        bar = pygame.Rect(0, 0, 400, 16)
+        bar.center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+        pygame.draw.rect(self.screen, "#F5EBEB", bar, 2)
+        pygame.draw.rect(self.screen, "#1BABB5",
+                         (bar.x + 3, bar.y + 3, (bar.width - 6) * done // total, bar.height - 6))
+
+        label = TEXT_CACHE.render(FONT_POOL.get(None, 22), f"Loading {os.path.basename(name)}",
+                                  True, "#F5EBEB")
+        self.screen.blit(label, label.get_rect(midbottom=(bar.centerx, bar.top - 8)))
+        pygame.display.update()
+
+    def change_scene(self, name: str) -> None:
+        ''':method: used to change the game state.
+
+            a scene already on the stack is uncovered, a stacked scene (i.e settings) is
+            pushed over the current one, otherwise the scene replaces the whole stack.
+        '''
+        scene = self._scenes[name]
+        if scene is self.scenes.top:
+            return
+
+        if scene in self.scenes:
+            while self.scenes.top is not scene:
+                self.scenes.pop()
+        elif scene.stacked:
+            self.scenes.push(scene)
+        else:
+            self.scenes.reset(scene)
+
     def update(self, delta_time: float, **kw) -> None:
         ''':method: used to update all the game related stuff.
 
             kw: contains all the inputs data.
         '''
+        scene = self.scenes.top
 
-        # game code -------------------------------------
-        if self._game_state == "Menu":
-            self.screen.fill("#383838")
-            self.gameui.show_gamemenu(self.screen)
-            self.gameui.show_about_btn(self.screen)
-
-            '''
-            if continuation of the game is possible than the continue button gets
-            highlighted.
-            '''
-            self.gameui.gamemenu_boxlayout.chlidren[1].active = self._gamedata["continue"]
-
-            # trigger the functions according to the button pressed.
-            # `New Game` button pressed.
-            if self.gameui.gamemenu_boxlayout.chlidren[0].pressed:
-                self._game_state = "Start New Game"  # game state changed
-                '''
-                only the the assert would draw and nothing gets updated.
-                '''
-                self._allow_update = False
-
-            # `Continue` button pressed and continuation is possible.
-            elif self.gameui.gamemenu_boxlayout.chlidren[1].pressed and self._gamedata["continue"]:
-                # placing entity to the previous position.
-                self.flappy.rect.topleft = self._gamedata["entity"]["pos"]
-
-                # placing all the obstical for the game to the previous position.
-                self.obstical._custom_pipe_pos(self._gamedata["pipes_pos"]["toppipe_list"],
-                                               self._gamedata["pipes_pos"]["bottompipe_list"])
-
-                # placing all the environment for the game to the previous position.
-                self.base_image.moving_images["img1"][1].topleft = self._gamedata["other_entity"]["base_pos"]["img1"]
-                self.base_image.moving_images["img2"][1].topleft = self._gamedata["other_entity"]["base_pos"]["img2"]
-                self.background_day_image.moving_images["img1"][1].topleft = self._gamedata["other_entity"]["background_pos"]["img1"]
-                self.background_day_image.moving_images["img2"][1].topleft = self._gamedata["other_entity"]["background_pos"]["img2"]
-
-                # set previous score.
-                self.obstical.score = self._gamedata["score"]
-                self.obstical.previous_score = self._gamedata["previous_score"]
-
-                # start the game as previous
-                self._game_state = "Start New Game"
-                self._allow_update = False
-
-            # `Setting` button is pressed.
-            elif self.gameui.gamemenu_boxlayout.chlidren[2].pressed:
-                '''
-                active the fps button which is using by the game.
-                '''
-                if self._gamedata["fps"] == 30:
-                    self.gameui.settingmenu_boxlayout_1.chlidren[1].active = True
-                else:
-                    self.gameui.settingmenu_boxlayout_1.chlidren[2].active = True
-
-                # changed the game state
-                '''
-                setting game state is required because in those blocks of settings.
-                content a code that are updated in each frame when the game state
-                is set to be "Settings"
-                '''
-                self._game_state = "Settings"
-
-            # `About` button is pressed
-            elif self.gameui.about_btn.pressed:
-                # same reason as like the `Setting` button.
-                self._game_state = "About"
-
-        # Gets updated in each frame when 'Setting' is activate.
-        elif self._game_state == "Settings":
-            self.screen.fill("#383838")
-            self.gameui.show_settingmenu(self.screen)
-
-            if kw["K_x"]:
-                self._game_state = "Menu"
-
-            # trigger functions when the button inside the setting menu get pressed.
-            children = self.gameui.settingmenu_boxlayout_1.chlidren
-
-            # TODO: make the below code more clean.
-            # handles the state of fps buttons and game fps setting
-            if children[2].pressed:
-                children[2].active = True
-                # updates the entire game fps
-                self._gamedata["fps"] = 60
-            elif children[1].pressed:
-                children[2].active = False
-                # updates the entire game fps
-                self._gamedata["fps"] = 30
-
-            children[1].active = not children[2].active
-
-        # Gets updated in each frame when 'About' is activate.
-        elif self._game_state == "About":
-            # textbox content all the details for the game gets visible.
-            self.textbox.blit(self.screen)
-
-            if kw["K_x"]:
-                self._game_state = "Menu"
-
-        # Gets updated in each frame when 'Start New Game' is activate.
-        elif self._game_state == "Start New Game":
-            # called when the game is not over and ready to play.
-            if not self._gameover:
-                # drawing game background.
-                self.background_day_image.blit(self.screen)
-
-                self.flappy.blit(self.screen)  # entity.
-
-                # drawing game environment
-                self.obstical.toppipe.draw(self.screen)
-                self.obstical.bottompipe.draw(self.screen)
-                self.base_image.blit(self.screen)
-                self.gameui.show_number(self.screen, str(self.obstical.score))
-
-                # if allow update is True
-                if self._allow_update:
-                    # update all the entities.
-                    self.background_day_image.move_image(self.screen, 50, delta_time, (-1, 0))
-                    self.flappy.update(delta_time, **kw)
-                    self.obstical.update(delta_time)
-                    self.base_image.move_image(self.screen, 100, delta_time, (-1, 0))
-
-                    # check collision of entity with the pipes
-                    if self.obstical.collision(self.flappy.collision_rect):
-                        self.hit.play()
-                        self._allow_update = False
-                        self._gameover = True
-
-                    # check collision of the entity with the base
-                    if self.base_image.collision(self.flappy.collision_rect):
-                        self.hit.play()
-                        self._allow_update = False
-                        self._gameover = True
-
-                    '''
-                    play the sound when the entity flap it's wings.
-                    '''
-                    if kw["K_SPACE"]:
-                        self.wing.play()
+        '''
+        the whole screen is pushed when the scene changes or when the game is running,
+        otherwise the scene pushes only the widgets which changed.
+        '''
+        drawn = (scene, self._gameover, self._allow_update)
+        if drawn != self._drawn_scene or \
+           (isinstance(scene, PlayScene) and self._allow_update and not self._gameover):
+            self.display.invalidate()
+        self._drawn_scene = drawn
 
-                    '''
-                    play sound when the point get incresed
-                    '''
-                    if self.obstical.score > self.obstical.previous_score:
-                        self.point.play()
-                        self.obstical.previous_score = self.obstical.score
-                else:
-                    # message show when update is False
-                    '''
-                    This message is show during the game start, continuation of the game,
-                    and also during the game get paused.
-                    '''
-                    self.gameui.start_message(self.screen)
+        # focus and clicks of the buttons of the active scene.
+        self.input.route(scene.buttons)
 
-                '''
-                below code handles the functionality of the pause mechanism by
-                manipulating :attr self._allow_update:
-                '''
-                if kw["K_p"] and self._allow_update:
-                    self._allow_update = False
-                elif kw["K_p"] and not self._allow_update:
-                    self._allow_update = True
-                elif kw["K_SPACE"] and not self._allow_update:
-                    self._allow_update = True
-
-                '''
-                during the game is running, and the back button is pressed then the
-                continuation data gets save, and continuation gets updated.
-                '''
-                if kw["K_x"]:
-                    # store the entity data.
-                    self._gamedata["entity"] = {
-                                            "weight": self.flappy.weight,
-                                            "fly_speed": self.flappy.fly_speed,
-                                            "pos": self.flappy.rect.center}
-
-                    # store the list of pipe position as a data of both top-pipes and bottom-pipes.
-                    self._gamedata["pipes_pos"] = {
-                    "toppipe_list": [pipe.rect.topleft for pipe in self.obstical.toppipe_list],
-                    "bottompipe_list": [pipe.rect.topleft for pipe in self.obstical.bottompipe_list]}
-
-                    # store the data of other entities i.e environment stuff.
-                    self._gamedata["other_entity"] = {"base_pos": {
-                                "img1": self.base_image.moving_images["img1"][1].topleft,
-                                "img2": self.base_image.moving_images["img2"][1].topleft
-                                },
-                                "background_pos": {
-                                "img1": self.background_day_image.moving_images["img1"][1].topleft,
-                                "img2": self.background_day_image.moving_images["img2"][1].topleft}
-                    }
-
-                    # continuation get activate and score is preserved.
-                    self._gamedata["continue"] = True
-                    self._gamedata["score"] = self.obstical.score
-                    self._gamedata["previous_score"] = self.obstical.previous_score
-
-                    # back to the main menu
-                    self._game_state = "Menu"
-                    self.new_game()
-
-            # called when the game gets over.
-            elif self._gameover:
-                # store high-score data if score is greater.
-                if self.obstical.score > self._gamedata["highscore"]:
-                    self._gamedata["highscore"] = self.obstical.score
-
-                # if high-score is greater than '0' it gets displayed on screen.
-                if self._gamedata["highscore"]:
-                    self.gameui.show_highscore(self.screen, self._gamedata["highscore"])
-
-                # finally game-over message would be shown.
-                self.gameui.gameover_message(self.screen)
-
-                if kw["K_x"]:
-                    # back to the main menu
-                    self._game_state = "Menu"
-                    # reset the game over button
-                    self.new_game()
-                    self._gamedata["continue"] = False
-
-            if kw["K_r"] and self._gameover:
-                # resume the game and its state
-                self.new_game()
+        # game code -------------------------------------
+        scene.update(delta_time, kw)
+
+    def continue_game(self) -> None:
+        ''':method: used to place the game as it was when the continuation got saved.'''
+        # placing entity to the previous position.
+        self.flappy.move_to(center=self._gamedata["entity"]["pos"])
+
+        # placing all the obstical for the game to the previous position.
+        self.obstical._custom_pipe_pos(self._gamedata["pipes_pos"]["toppipe_list"],
+                                       self._gamedata["pipes_pos"]["bottompipe_list"])
+
+        # placing all the environment for the game to the previous position.
+        self.base_image.move_to(self._gamedata["other_entity"]["base_pos"]["img1"])
+        self.background_day_image.move_to(self._gamedata["other_entity"]["background_pos"]["img1"])
+
+        # set previous score.
+        self.obstical.score = self._gamedata["score"]
+        self.obstical.previous_score = self._gamedata["previous_score"]
+
+        # continued game is not started from a seed, so it can't be replayed.
+        self.recorder.stop()
+
+    def save_continuation(self) -> None:
+        ''':method: used to save the running game, so it can be continued from the menu.'''
+        # store the entity data.
+        self._gamedata["entity"] = {
+                                "weight": self.flappy.weight,
+                                "fly_speed": self.flappy.fly_speed,
+                                "pos": tuple(self.flappy.position)}
+
+        # store the list of pipe position as a data of both top-pipes and bottom-pipes.
+        toppipe_list, bottompipe_list = self.obstical.pipe_positions()
+        self._gamedata["pipes_pos"] = {"toppipe_list": toppipe_list,
+                                       "bottompipe_list": bottompipe_list}
+
+        # store the data of other entities i.e environment stuff.
+        self._gamedata["other_entity"] = {"base_pos": {
+                    "img1": tuple(self.base_image.position),
+                    "img2": self.base_image.rects[1].topleft
+                    },
+                    "background_pos": {
+                    "img1": tuple(self.background_day_image.position),
+                    "img2": self.background_day_image.rects[1].topleft}
+        }
+
+        # continuation get activate and score is preserved.
+        self._gamedata["continue"] = True
+        self._gamedata["score"] = self.obstical.score
+        self._gamedata["previous_score"] = self.obstical.previous_score
 
     def new_game(self) -> None:
         ''':method: used to set-up new game.'''
 
+        # every game is started from its own seed, and gets recorded.
+        seed = self.rng.getrandbits(32)
+        self.recorder.start(seed, self.timestep.rate, self.simulation)
+
         # reset all the values.
         self._allow_update = True
-        self.obstical.generate_pipe()
-        self.obstical.score = 0
-        self.obstical.previous_score = self.obstical.score
-
-        self.flappy.rect.topleft = (480 // 2, 368 // 2)
+        self.simulation.reset(seed)
+        self.timestep.reset()
+        self._pending_flap = False
         self._gameover = False
 
+    def save_replay(self) -> None:
+        ''':method: used to save the replay of the game which just got over, only if the
+            `record_replay` is enabled in the game data.
+        '''
+        replay = self.recorder.finish(self.simulation)
+        if replay is None or not self._gamedata.get("record_replay", False):
+            return
+
+        os.makedirs(REPLAY_PATH, exist_ok=True)
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed}-{replay.score}.flr"
+        replay.save(os.path.join(REPLAY_PATH, filename))
+
     def run(self) -> None:
         ''':method: main-loop of the game.'''
 
         # load all the assert for the game.
         self.setup()
 
+        # time in milli-seconds an idle scene sleeps without an input, 0 to disable it.
+        idle_timeout = self._gamedata.get("idle_timeout_ms", 250)
+
         # running main-loop of the game
         running = True
         while running:
-            # shortcut keys responsible for controlling inputs in the whole game.
-            self.ShortCuts = {"K_SPACE": False, "K_r": False, "K_x": False,
-                              "K_p": False}
-
-            # tracking the pygame events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT or \
-                   (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                    running = False
-
-                # check key presses for the game
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.ShortCuts["K_SPACE"] = True
+            self.profiler.begin_frame()
 
-                    if event.key == pygame.K_p:
-                        self.ShortCuts["K_p"] = True
-
-                    if event.key == pygame.K_r:
-                        self.ShortCuts["K_r"] = True
-
-                    if event.key == pygame.K_x:
-                        self.ShortCuts["K_x"] = True
+            '''
+            nothing moves in an idle scene (menus, pause, game over), so the loop sleeps
+            until an input arrives or the timeout is over, instead of drawing at full fps.
+            '''
+            events = None
+            if idle_timeout and self.scenes.top.idle:
+                events = self.input.wait(idle_timeout)
+                self.profiler.mark("wait")
+
+            if self.watchdog:
+                self.watchdog.begin_frame()
+
+            # all the events of the frame are consumed once into edge-triggered actions.
+            actions = self.input.poll(events)
+            if actions & ACTION_QUIT:
+                running = False
+
+            # window content is lost, the whole screen needs to be pushed again.
+            if self.input.exposed:
+                self.display.invalidate()
+
+            # show/hide the frame-time profiler.
+            if actions & ACTION_PROFILER:
+                self.profiler.visible = not self.profiler.visible
+                # the scene is drawn again over the hidden overlay.
+                self.scenes.top.invalidate()
+                self.display.invalidate()
+            self.profiler.mark("input")
 
-            # delta time of the entire game.
-            delta_time = self.clock.tick(self._gamedata["fps"]) / 1000.0
+            '''
+            delta time of the entire game, the sleep pacing sleeps and spins the last
+            milli-second, the precise pacing spins the whole wait, the frame time is
+            steadier but it burns a core.
+            the wait is not part of the frame budget of the watchdog, like the idle wait.
+            '''
+            if self.watchdog:
+                self.watchdog.pause()
+            delta_time = self.pacer.tick(self._gamedata["fps"],
+                                         self._gamedata.get("precise_pacing", False))
+            if self.watchdog:
+                self.watchdog.resume()
+            self.profiler.mark("wait")
             # update the whole game.
             self.update(delta_time, **self.ShortCuts)
-            pygame.display.update()
+            if self.profiler.visible:
+                self.display.add(self.profiler.draw(self.screen))
+            self.profiler.mark("draw")
+            self.display.update()
+            self.profiler.mark("display")
+            self.profiler.end_frame()
+            if self.watchdog:
+                self.watchdog.end_frame(self.scenes.top.name, self.obstical.score)
+
+        if self.watchdog:
+            self.watchdog.close()
+
+        # frame-times of the last frames are dumped if a csv file is given.
+        if self._gamedata.get("profile_csv"):
+            self.profiler.dump_csv(self._gamedata["profile_csv"])
 
         # quit the game
         save(os.path.join(ASSERT_PATH, DATA_FILENAME), self._gamedata)
@@ -391,10 +630,63 @@ class Game:
         exit()
 
 
+def play_replay(filename: str, speed: int) -> None:
+    ''':function: used to play the replay file.
+
+        :param speed: 1, 4, 16... times the real time, 0 to simulate it headless as fast as
+            possible and check that the result is the same as the recorded one.
+
+        Note: the game exits with the status 1 and the error on stderr if the file can't
+        be loaded.
+    '''
+    try:
+        replay = Replay.load(filename)
+    except (OSError, ValueError) as error:
+        # i.e a missing file, or a replay of an other version.
+        sys.exit(f"can't play the replay: {error}")
+
+    if not speed:
+        simulation = Simulation.from_data(fetch(os.path.join(ASSERT_PATH, DATA_FILENAME)),
+                                          convert=False)
+        start = time.perf_counter()
+        result = ReplayPlayer(replay, simulation).run_headless()
+        elapsed = time.perf_counter() - start
+        print(f"steps: {result['steps']}, score: {result['score']}, "
+              f"checksum: {result['checksum']:08x}, "
+              f"{'match' if result['match'] else 'MISMATCH'} "
+              f"({result['steps'] / replay.sim_rate / max(elapsed, 1e-9):.0f}x real time)")
+        return
+
+    pygame.init()
+    game = Game(SCREEN_SIZE, f"{TITLE} - replay x{speed}")
+    game.setup()
+    # the replay is drawn with a fixed frame time, uncapped fps falls back to 60.
+    ReplayPlayer(replay, game.simulation).play(game.screen, game.renderer, speed,
+                                               game._gamedata["fps"] or 60)
+    pygame.quit()
+
+
 def main():
     ''':function: entry point of the game.'''
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--seed", type=int, help="seed of the game")
+    parser.add_argument("--replay", help="replay file to play")
+    parser.add_argument("--speed", type=int, default=1,
+                        help="speed of the replay, 0 to re-simulate it headless")
+    parser.add_argument("--loose", action="store_true",
+                        help="load the assert from the files even if the bundle is built")
+    args = parser.parse_args()
+
+    # the packed bundle is used when it is built, the files are the development fallback.
+    if not args.loose and os.path.isfile(BUNDLE_PATH):
+        use_bundle(BUNDLE_PATH)
+
+    if args.replay:
+        play_replay(args.replay, args.speed)
+        return
+
     pygame.init()  # initializing pygame
-    Game(SCREEN_SIZE, TITLE).run()
+    Game(SCREEN_SIZE, TITLE, seed=args.seed).run()
 
 
 if __name__ == '__main__':